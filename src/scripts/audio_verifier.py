@@ -0,0 +1,431 @@
+# ═══════════════════════════════════════════════════════════════════
+# AUDIO VERIFIER vφ.718
+# Streaming STFT check of DNASymphony renders against the gate schedule
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# The WAV is memory-mapped and analysed block by block: Hann frames
+# with hop = nfft/4 (constant overlap-add, so every sample carries the
+# same total weight), centered so frame k sits at k·hop/fs seconds.
+# Only per-gate band peaks and the mean low-band power spectrum are
+# kept, so memory does not grow with the length of the file.
+#
+#   python audio_verifier.py SYMPHONY_18_GATES.wav MATRIX_ACTIVATION.wav
+#   python audio_verifier.py --self-test 1 10 108
+#
+# Symphony (mono): each audible gate must peak at
+#   f_i = 144·(1 + (i·γ mod 1)) + 718,   t_i = pos_i/16569 · duration
+# with level ∝ weight_i; gates of weight 0 must stay silent; the 7.83 Hz
+# Earth base must be present. Each gate is measured within ±3σ of t_i,
+# in a band reaching halfway to the nearest other gate frequency (a
+# peak on the band edge is reported as out of band). Activation
+# (stereo): 7.83 Hz left, 18.6 Hz right, no crosstalk. Expected peak times and levels follow
+# the σ = φ envelopes as cut off by the file edges; renders too short for
+# an envelope to fall to half maximum are checked in frequency/level only.
+# ═══════════════════════════════════════════════════════════════════
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from system_unification import DNASymphony, PHI, SCHUMANN, LUNAR
+
+KINDS = ('symphony', 'activation')
+
+# ═══════════════════════════════════════════════════════════════════
+# MEMORY-MAPPED WAV + BLOCK-WISE STFT
+# ═══════════════════════════════════════════════════════════════════
+
+def open_wav(path: str) -> Tuple[int, np.ndarray, float, float]:
+    """(sample rate, (n, channels) memmap, offset, scale to ±1.0)"""
+    from scipy.io import wavfile
+    fs, data = wavfile.read(path, mmap=True)
+    if data.ndim == 1:
+        data = data[:, None]
+    if data.dtype == np.uint8:
+        return fs, data, 128.0, 1 / 128
+    if np.issubdtype(data.dtype, np.integer):
+        return fs, data, 0.0, 1 / (np.iinfo(data.dtype).max + 1)
+    return fs, data, 0.0, 1.0
+
+def stft_blocks(data: np.ndarray, nfft: int, hop: int, offset: float = 0.0,
+                scale: float = 1.0, block_frames: int = 32) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield (first frame, |X| of shape (frames, channels, nfft//2 + 1)) per
+    block. Frame k covers samples [k·hop - nfft/2, k·hop + nfft/2), zero
+    padded at both ends; only that span is read from `data`.
+    """
+    n, channels = data.shape
+    frames = 1 + n // hop
+    window = np.hanning(nfft + 1)[:-1]      # periodic Hann: COLA at hop = nfft/4
+    half = nfft // 2
+    for k0 in range(0, frames, block_frames):
+        k1 = min(k0 + block_frames, frames)
+        s0, s1 = k0 * hop - half, (k1 - 1) * hop - half + nfft
+        buf = np.zeros((s1 - s0, channels))
+        lo, hi = max(s0, 0), min(s1, n)
+        buf[lo - s0:hi - s0] = (np.asarray(data[lo:hi], dtype=np.float64) - offset) * scale
+        segments = np.lib.stride_tricks.sliding_window_view(buf, nfft, axis=0)[::hop]
+        yield k0, np.abs(np.fft.rfft(segments * window, axis=-1))
+
+def parabolic(y_left: np.ndarray, y_mid: np.ndarray, y_right: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vertex offset (in samples, within ±0.5) and height of the parabola through 3 points"""
+    denom = y_left - 2 * y_mid + y_right
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = np.clip(np.where(denom < 0, 0.5 * (y_left - y_right) / denom, 0.0), -0.5, 0.5)
+    return delta, y_mid - 0.25 * (y_left - y_right) * delta
+
+def _db(ratio: float) -> float:
+    return float(20 * np.log10(max(ratio, 1e-12)))
+
+def frame_size(n: int, nfft_max: int = 65536, nfft_min: int = 1024) -> int:
+    """Largest power of two ≤ n (so at least one frame lies inside the file), capped"""
+    return int(min(nfft_max, max(nfft_min, 2 ** int(np.log2(max(n, 1))))))
+
+def expected_traces(schedule: List[Dict], n: int, fs: int, nfft: int, hop: int,
+                    frames: int) -> np.ndarray:
+    """
+    Window-weighted gate envelope per frame, (frames, gates): what the band
+    peak of gate i should follow, up to weight_i, with the Gaussian cut off
+    at the file edges and the window zero padded there as in stft_blocks
+    """
+    step = max(nfft // 512, 1)
+    offsets = np.arange(0, nfft, step)
+    window = np.hanning(nfft + 1)[:-1][offsets]
+    traces = np.zeros((frames, len(schedule)))
+    for j, gate in enumerate(schedule):
+        center = gate['start_time'] * fs
+        reach = 6 * PHI * fs + nfft
+        k0 = max(int((center - reach) // hop), 0)
+        k1 = min(int((center + reach) // hop) + 1, frames)
+        if k1 <= k0:
+            continue
+        samples = np.arange(k0, k1)[:, None] * hop - nfft // 2 + offsets
+        inside = (samples >= 0) & (samples < n)
+        envelope = np.exp(-((samples / fs - gate['start_time']) ** 2) / (2 * PHI ** 2))
+        traces[k0:k1, j] = (window * envelope * inside).sum(axis=1) / window.sum()
+    return traces
+
+def search_bands(frequencies: np.ndarray, bin_hz: float) -> np.ndarray:
+    """Half-width per gate: halfway to the nearest other gate, at least one bin"""
+    if len(frequencies) < 2:
+        return np.full(len(frequencies), bin_hz)
+    gaps = np.abs(frequencies[:, None] - frequencies[None, :])
+    np.fill_diagonal(gaps, np.inf)
+    return np.maximum(gaps.min(axis=1) / 2, bin_hz)
+
+def window_leakage(nfft: int, fs: int, max_hz: float = 200.0) -> Callable[[float, float], float]:
+    """Relative Hann response at the nearest edge of a ±band_hz band, vs (tone offset, band_hz) in Hz"""
+    oversample = 16
+    response = np.abs(np.fft.rfft(np.hanning(nfft + 1)[:-1], nfft * oversample))
+    response /= response[0]
+    resolution = fs / (nfft * oversample)
+    limit = int(max_hz / resolution)
+    # Monotone envelope: the band may sit on any sidelobe peak beyond the edge
+    envelope = np.maximum.accumulate(response[:limit][::-1])[::-1]
+
+    def leakage(offset_hz: float, band_hz: float) -> float:
+        distance = abs(offset_hz) - band_hz
+        if distance <= 0:
+            return 1.0
+        index = int(distance / resolution)
+        return float(envelope[index]) if index < limit else 0.0
+    return leakage
+
+# ═══════════════════════════════════════════════════════════════════
+# VERIFICATION
+# ═══════════════════════════════════════════════════════════════════
+
+def verify_wav(path: str, kind: Optional[str] = None, nfft: Optional[int] = None,
+               freq_tol: float = 0.25, time_tol: float = 0.25, level_tol: float = 1.0,
+               silence_db: float = -40.0, band_hz: Optional[float] = None) -> Dict:
+    """
+    Check a render against the schedule of its kind ('symphony' for
+    mono files, 'activation' for stereo when kind is None). Returns a
+    report with per-gate / per-component deviations and an overall 'ok'.
+    nfft defaults to frame_size(samples): 65536 for renders over ~1.5 s.
+    band_hz fixes the ±search band per gate (default: search_bands).
+    """
+    start = time.perf_counter()
+    fs, data, offset, scale = open_wav(path)
+    n, channels = data.shape
+    kind = kind or ('symphony' if channels == 1 else 'activation')
+    if kind not in KINDS:
+        raise ValueError(f"Unknown render kind '{kind}'")
+    duration = n / fs
+    nfft = nfft or frame_size(n)
+    hop = nfft // 4
+    bin_hz = fs / nfft
+    amplitude = 2 / np.hanning(nfft + 1)[:-1].sum()     # |X| → sinusoid amplitude
+
+    schedule = DNASymphony(fs).gate_schedule(duration) if kind == 'symphony' else []
+    frequencies = np.array([g['frequency'] for g in schedule])
+    widths = search_bands(frequencies, bin_hz) if band_hz is None else np.full(len(schedule), band_hz)
+    # Rounded inward so neighbouring bands never overlap
+    bands = [(int(np.ceil((f - w) / bin_hz)), int((f + w) / bin_hz)) for f, w in zip(frequencies, widths)]
+    low_bins = int(np.ceil(40 / bin_hz)) + 2
+
+    frames = 1 + n // hop
+    peak_amp = np.zeros((frames, len(schedule)))
+    peak_freq = np.zeros((frames, len(schedule)))
+    peak_edge = np.zeros((frames, len(schedule)), dtype=bool)
+    low_power = np.zeros((channels, low_bins))
+    # Stationary tones use interior frames only: zero padding at the file
+    # edges would smear them across the low band
+    centers = np.arange(frames) * hop
+    interior = (centers >= nfft // 2) & (centers + nfft // 2 <= n)
+
+    for k0, spectra in stft_blocks(data, nfft, hop, offset, scale):
+        k1 = k0 + len(spectra)
+        mix = spectra.mean(axis=1)
+        for j, (lo, hi) in enumerate(bands):
+            band = mix[:, lo:hi + 1]
+            top = band.argmax(axis=1)
+            # Maximum on the band edge: the tone lies outside the band
+            peak_edge[k0:k1, j] = (top == 0) | (top == hi - lo)
+            idx = np.clip(top, 1, hi - lo - 1)
+            rows = np.arange(len(band))
+            log = np.log(band + 1e-300)
+            delta, height = parabolic(log[rows, idx - 1], log[rows, idx], log[rows, idx + 1])
+            peak_freq[k0:k1, j] = (lo + idx + delta) * bin_hz
+            peak_amp[k0:k1, j] = np.exp(height) * amplitude
+        low_power += (spectra[interior[k0:k1], :, :low_bins] ** 2).sum(axis=0)
+
+    traces = expected_traces(schedule, n, fs, nfft, hop, frames)
+    gates = _check_gates(schedule, peak_amp, peak_freq, peak_edge, traces, interior,
+                         hop / fs, duration, widths, window_leakage(nfft, fs),
+                         freq_tol, time_tol, level_tol, silence_db)
+    low = np.sqrt(low_power / max(int(interior.sum()), 1)) * amplitude
+    if kind == 'symphony':
+        expected = [('Earth (Schumann)', 0, SCHUMANN, True), ('Lunar', 0, LUNAR, False)]
+    else:
+        expected = [('Earth (Schumann) L', 0, SCHUMANN, True), ('Lunar R', 1, LUNAR, True),
+                    ('Lunar crosstalk L', 0, LUNAR, False), ('Earth crosstalk R', 1, SCHUMANN, False)]
+    components = [_check_component(name, low[ch], bin_hz, freq, present, freq_tol, silence_db)
+                  for name, ch, freq, present in expected]
+
+    return {
+        'path': path,
+        'kind': kind,
+        'sample_rate': fs,
+        'channels': channels,
+        'duration': duration,
+        'nfft': nfft,
+        'hop': hop,
+        'frames': frames,
+        'analysis_seconds': time.perf_counter() - start,
+        'gates': gates,
+        'components': components,
+        'ok': all(g['ok'] for g in gates) and all(c['ok'] for c in components),
+    }
+
+def _peak(trace: np.ndarray) -> Tuple[int, float, float]:
+    """(frame, sub-frame offset, height) of a trace maximum, log-parabolic"""
+    k = int(trace.argmax())
+    if 0 < k < len(trace) - 1:
+        delta, height = parabolic(*np.log(trace[k - 1:k + 2] + 1e-300))
+        return k, float(delta), float(np.exp(height))
+    return k, 0.0, float(trace[k])
+
+def _check_gates(schedule: List[Dict], peak_amp: np.ndarray, peak_freq: np.ndarray,
+                 peak_edge: np.ndarray, traces: np.ndarray, interior: np.ndarray,
+                 frame_seconds: float, duration: float, widths: np.ndarray,
+                 leakage: Callable[[float, float], float], freq_tol: float, time_tol: float,
+                 level_tol: float, silence_db: float) -> List[Dict]:
+    """
+    Peak time/frequency/level per audible gate, residual level per silent
+    gate, each measured within ±3σ of the gate's slot so that neighbours
+    sounding elsewhere in time cannot take over its band. Expected times
+    and levels come from the edge-truncated traces; timing is only
+    checked where the envelope falls to half its peak inside the file
+    (otherwise the render is too short to place it).
+    """
+    if not schedule:
+        return []
+    frames = len(peak_amp)
+    weights = np.array([g['weight'] for g in schedule])
+    expected = traces * weights
+    audible = [j for j, g in enumerate(schedule) if g['weight'] > 0]
+    times = np.arange(frames) * frame_seconds
+    slots = [np.abs(times - g['start_time']) <= 3 * PHI for g in schedule]
+    for slot in slots:
+        if not slot.any():
+            slot[:] = True
+    measured = []
+    for j, slot in enumerate(slots):
+        first = int(np.flatnonzero(slot)[0])
+        k, delta, amp = _peak(peak_amp[slot, j])      # the slot is one contiguous run
+        measured.append((first + k, delta, amp))
+    predicted = [_peak(expected[:, j]) for j in range(len(schedule))]
+    loudest = max(measured[j][2] for j in audible)
+    loudest_expected = max(predicted[j][2] for j in audible)
+    # Model amplitude → measured amplitude units
+    calibration = loudest / loudest_expected if loudest_expected > 0 else 0.0
+    half_width = PHI * np.sqrt(2 * np.log(2))          # envelope half maximum at t ± 1.18σ
+
+    gates = []
+    for j, gate in enumerate(schedule):
+        (k, delta, amp), (ek, edelta, eamp) = measured[j], predicted[j]
+        entry = {
+            'gate': gate['gate'],
+            'expected_frequency': gate['frequency'],
+            'scheduled_time': gate['start_time'],
+            'expected_time': (ek + edelta) * frame_seconds,
+            'expected_level_db': _db(eamp / loudest_expected) if eamp > 0 else _db(0.0),
+        }
+        if gate['weight'] == 0:
+            # Silent by design: loudest residual within ±3σ of its slot, allowing
+            # for window leakage of audible gates sounding nearby in frequency.
+            # Interior frames only: a window cut off by the file edge leaks far
+            # more than the Hann response accounts for.
+            around = slots[j] & interior if (slots[j] & interior).any() else interior.copy()
+            if not around.any():
+                around = slots[j]
+            residual = float(peak_amp[around, j].max())
+            leaked = sum(expected[around, m] * leakage(schedule[m]['frequency'] - gate['frequency'], widths[j])
+                         for m in audible).max() * calibration
+            allowed = max(loudest * 10 ** (silence_db / 20), 2 * leaked)
+            entry.update(level_db=_db(residual / loudest), allowed_db=_db(allowed / loudest),
+                         ok=bool(residual <= allowed))
+        else:
+            t = gate['start_time']
+            timed = 0 <= t <= duration and (t - half_width >= 0 or t + half_width <= duration)
+            # Frequency from the loudest interior frame of the slot when there is one
+            own = slots[j] & interior if (slots[j] & interior).any() else slots[j]
+            fk = int(np.flatnonzero(own)[peak_amp[own, j].argmax()])
+            out_of_band = bool(peak_edge[fk, j])
+            entry.update(
+                # A peak clipped to the band edge says nothing about the true offset
+                measured_frequency=None if out_of_band else float(peak_freq[fk, j]),
+                out_of_band=out_of_band,
+                measured_time=(k + delta) * frame_seconds,
+                level_db=_db(amp / loudest),
+                time_checked=bool(timed),
+            )
+            entry['frequency_deviation'] = (None if out_of_band else
+                                            entry['measured_frequency'] - entry['expected_frequency'])
+            entry['time_deviation'] = entry['measured_time'] - entry['expected_time']
+            entry['level_deviation_db'] = entry['level_db'] - entry['expected_level_db']
+            entry['ok'] = bool(not out_of_band and abs(entry['frequency_deviation']) <= freq_tol and
+                               (not timed or abs(entry['time_deviation']) <= time_tol) and
+                               abs(entry['level_deviation_db']) <= level_tol)
+        gates.append(entry)
+    return gates
+
+def _check_component(name: str, spectrum: np.ndarray, bin_hz: float, frequency: float,
+                     present: bool, freq_tol: float, silence_db: float) -> Dict:
+    """Stationary tone in the mean low-band spectrum of one channel"""
+    lo = max(int((frequency - 1) / bin_hz), 1)
+    hi = int(np.ceil((frequency + 1) / bin_hz))
+    k = lo + int(spectrum[lo:hi + 1].argmax())
+    log = np.log(spectrum[k - 1:k + 2] + 1e-300)
+    delta, height = parabolic(*log)
+    peak = float(np.exp(height))
+    level = _db(peak / max(float(spectrum.max()), peak, 1e-300))
+    entry = {'component': name, 'expected_frequency': frequency, 'present': present,
+             'amplitude': peak, 'level_db': level}
+    if present:
+        entry['measured_frequency'] = (k + float(delta)) * bin_hz
+        entry['frequency_deviation'] = entry['measured_frequency'] - frequency
+        entry['ok'] = bool(abs(entry['frequency_deviation']) <= freq_tol and level > silence_db)
+    else:
+        entry['ok'] = bool(level <= silence_db)
+    return entry
+
+SELF_TEST_SECONDS = (1, 10, 108, 600)    # include the benchmark_suite sizes
+
+def self_test(durations=SELF_TEST_SECONDS, **options) -> List[Dict]:
+    """Render clean symphony + activation audio per duration and verify each"""
+    import contextlib
+    import io
+    import os
+    import tempfile
+    reports = []
+    with tempfile.TemporaryDirectory(prefix='psi718_verify_') as tmp:
+        for seconds in durations:
+            symphony = DNASymphony()
+            paths = {kind: os.path.join(tmp, f'{kind}_{seconds}.wav') for kind in KINDS}
+            with contextlib.redirect_stdout(io.StringIO()):
+                symphony.generate_symphony(duration=float(seconds), filename=paths['symphony'])
+                symphony.generate_activation_audio(duration=float(seconds), filename=paths['activation'])
+            reports.extend(verify_wav(path, kind, **options) for kind, path in paths.items())
+    return reports
+
+# ═══════════════════════════════════════════════════════════════════
+# REPORT + CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def render_report(report: Dict) -> str:
+    mark = lambda ok: '✓' if ok else '×'
+    lines = [
+        "=" * 78,
+        f"AUDIO VERIFIER | {report['path']} | {report['kind']} | "
+        f"{report['duration']:.1f}s @ {report['sample_rate']} Hz",
+        "=" * 78,
+    ]
+    for g in report['gates']:
+        if 'measured_frequency' in g:
+            lines.append(
+                f"  {mark(g['ok'])} Gate {g['gate']:2d} | {g['expected_frequency']:8.2f} Hz "
+                + ("Δf  out of band" if g['out_of_band'] else f"Δf {g['frequency_deviation']:+7.3f}     ") +
+                f" | t {g['expected_time']:7.2f}s "
+                + (f"Δt {g['time_deviation']:+6.3f}" if g['time_checked'] else "Δt  (n/a)") +
+                f" | level {g['level_db']:6.1f} dB "
+                f"Δ {g['level_deviation_db']:+5.2f}")
+        else:
+            lines.append(f"  {mark(g['ok'])} Gate {g['gate']:2d} | silent (weight 0) | "
+                         f"residual {g['level_db']:6.1f} dB (≤ {g['allowed_db']:.1f})")
+    for c in report['components']:
+        if c['present']:
+            lines.append(f"  {mark(c['ok'])} {c['component']:<20} {c['expected_frequency']:6.2f} Hz "
+                         f"Δf {c['frequency_deviation']:+7.3f} | level {c['level_db']:6.1f} dB")
+        else:
+            lines.append(f"  {mark(c['ok'])} {c['component']:<20} absent | "
+                         f"level {c['level_db']:6.1f} dB")
+    lines.append("-" * 78)
+    failed = sum(not e['ok'] for e in report['gates'] + report['components'])
+    lines.append(f"  {mark(report['ok'])} {'OK' if report['ok'] else f'{failed} deviation(s)'} | "
+                 f"{report['frames']} frames (nfft {report['nfft']}, hop {report['hop']}) "
+                 f"in {report['analysis_seconds']:.2f}s")
+    lines.append("=" * 78)
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Ψ-718 spectral verification of DNASymphony renders")
+    parser.add_argument('wav', nargs='*')
+    parser.add_argument('--self-test', nargs='*', type=float, metavar='SECONDS',
+                        help=f"Verify fresh clean renders instead (default: {list(SELF_TEST_SECONDS)} s)")
+    parser.add_argument('--kind', choices=KINDS, default=None,
+                        help="Default: symphony for mono, activation for stereo")
+    parser.add_argument('--nfft', type=int, default=None,
+                        help="Frame size (default: 65536, less for renders under ~1.5 s)")
+    parser.add_argument('--freq-tol', type=float, default=0.25, help="Hz")
+    parser.add_argument('--time-tol', type=float, default=0.25, help="Seconds")
+    parser.add_argument('--level-tol', type=float, default=1.0, help="dB")
+    parser.add_argument('--json', metavar='PATH', help="Write all reports as JSON")
+    args = parser.parse_args()
+    if not args.wav and args.self_test is None:
+        parser.error("give WAV files or --self-test")
+
+    options = dict(nfft=args.nfft, freq_tol=args.freq_tol, time_tol=args.time_tol,
+                   level_tol=args.level_tol)
+    reports = [verify_wav(path, args.kind, **options) for path in args.wav]
+    if args.self_test is not None:
+        reports += self_test(args.self_test or SELF_TEST_SECONDS, **options)
+    for report in reports:
+        print(render_report(report))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+        print(f"✓ Report saved: {args.json}")
+    if not all(report['ok'] for report in reports):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+# ═══════════════════════════════════════════════════════════════════
+# BENCHMARK SUITE vφ.718
+# Hot paths of system_unification.py at parameterized input sizes
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# python benchmark_suite.py run --quick --save baseline.json
+# python benchmark_suite.py run --quick --compare baseline.json
+#
+# Each case reports latency percentiles, throughput (items/s) and the
+# peak traced memory of one extra call. --compare exits with status 1
+# when a case's median latency grew by more than --threshold.
+# ═══════════════════════════════════════════════════════════════════
+
+import argparse
+import atexit
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from audio_verifier import verify_wav
+from system_unification import (
+    ZetaRiemann, ConsciousnessField, VectorIntention, BiblicalDecoder,
+    DNASymphony, gate_hamiltonian, evolve_gate_state,
+)
+
+RESULTS_VERSION = 1
+
+@dataclass
+class BenchCase:
+    """
+    One hot path. setup(size) returns a zero-argument callable that
+    processes `items(size)` items per call.
+    """
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    sizes: List[int]
+    quick_sizes: List[int]
+    unit: str
+    items: Callable[[int], int] = lambda size: size
+    repeats: int = 10
+
+# ═══════════════════════════════════════════════════════════════════
+# CASES
+# ═══════════════════════════════════════════════════════════════════
+
+_TMP = tempfile.mkdtemp(prefix='psi718_bench_')
+atexit.register(shutil.rmtree, _TMP, ignore_errors=True)
+_RNG = np.random.default_rng(718)
+
+def _zeta(terms: int):
+    # E = 0.5 keeps terms from decaying below 1e-12, so all `terms` are summed
+    return lambda: ZetaRiemann.critical_line(0.5, terms=terms)
+
+def _psi(points: int):
+    field = ConsciousnessField()
+    t = _RNG.uniform(0.5, 10.5, points).tolist()
+    x = _RNG.uniform(100, 1100, points).tolist()
+
+    def run():
+        for i in range(points):
+            field.calculate_psi(t[i], x[i], i % 18)
+    return run
+
+def _psi_batch(points: int):
+    field = ConsciousnessField()
+    t, x = _RNG.uniform(0.5, 10.5, points), _RNG.uniform(100, 1100, points)
+    gates = np.arange(points) % 18
+    return lambda: field.calculate_psi_batch(t, x, gates)
+
+def _vi(millis: int):
+    # Integration interval [0, millis/1000]: quad cost grows with oscillations
+    engine = VectorIntention(ConsciousnessField())
+    return lambda: engine.calculate_vi(0, millis / 1000, 500.0, 3)
+
+def _vi_batch(points: int):
+    engine = VectorIntention(ConsciousnessField())
+    t, x = _RNG.uniform(0.5, 10.5, points), _RNG.uniform(100, 1100, points)
+    gates = np.arange(points) % 18
+    return lambda: engine.calculate_vi_batch(0, t, x, gates)
+
+def _decode(chars: int):
+    # Unmapped reference → text_to_params → calculate_psi + calculate_vi
+    decoder = BiblicalDecoder()
+    text = ("Na początku stworzył Bóg niebo i ziemię " * (chars // 40 + 1))[:chars]
+    return lambda: decoder.decode_verse("Benchmark 1:1", text)
+
+def _symphony(seconds: int):
+    symphony = DNASymphony()
+    path = os.path.join(_TMP, 'symphony.wav')
+    return lambda: symphony.generate_symphony(duration=float(seconds), filename=path)
+
+def _activation(seconds: int):
+    symphony = DNASymphony()
+    path = os.path.join(_TMP, 'activation.wav')
+    return lambda: symphony.generate_activation_audio(duration=float(seconds), filename=path)
+
+def _verify(seconds: int):
+    # One render per size; only the spectral check is timed
+    path = os.path.join(_TMP, f'verify_{seconds}.wav')
+    with contextlib.redirect_stdout(io.StringIO()):
+        DNASymphony().generate_symphony(duration=float(seconds), filename=path)
+    if not verify_wav(path)['ok']:
+        raise RuntimeError(f"Clean {seconds}s symphony fails verification; not timing it")
+    return lambda: verify_wav(path)
+
+def _evolution(steps: int):
+    H = gate_hamiltonian(18)
+    psi0 = np.zeros(18, dtype=complex)
+    psi0[[0, 7, 17]] = 1 / np.sqrt(3)
+    times = np.linspace(0, 5, steps)
+    return lambda: evolve_gate_state(H, psi0, times)
+
+CASES = [
+    BenchCase('zeta.critical_line', _zeta, [500, 5000, 50000], [500, 5000], 'terms'),
+    BenchCase('field.calculate_psi', _psi, [1, 10, 100], [1, 10], 'points', repeats=5),
+    BenchCase('field.calculate_psi_batch', _psi_batch, [1000, 100000, 1000000], [1000, 100000], 'points'),
+    BenchCase('vi.calculate_vi', _vi, [10, 100, 1000], [10], 'calls',
+              items=lambda size: 1, repeats=3),
+    BenchCase('vi.calculate_vi_batch', _vi_batch, [1000, 100000, 1000000], [1000, 100000], 'verses'),
+    BenchCase('decoder.decode_verse', _decode, [40, 400], [40], 'verses',
+              items=lambda size: 1, repeats=3),
+    BenchCase('symphony.generate_symphony', _symphony, [1, 10, 108], [1], 'audio seconds', repeats=3),
+    BenchCase('symphony.generate_activation_audio', _activation, [1, 10, 60], [1], 'audio seconds', repeats=3),
+    BenchCase('audio.verify_wav', _verify, [10, 108, 600], [10], 'audio seconds', repeats=3),
+    BenchCase('evolution.evolve_gate_state', _evolution, [100, 500, 5000], [100, 500], 'time steps', repeats=5),
+]
+
+# ═══════════════════════════════════════════════════════════════════
+# MEASUREMENT
+# ═══════════════════════════════════════════════════════════════════
+
+def measure(case: BenchCase, size: int, repeats: Optional[int] = None) -> Dict:
+    """Warm-up call, `repeats` timed calls, then one traced call for peak memory"""
+    fn = case.setup(size)
+    repeats = repeats or case.repeats
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    samples = np.array(samples)
+    median = float(np.median(samples))
+    return {
+        'case': case.name,
+        'size': size,
+        'unit': case.unit,
+        'repeats': repeats,
+        'latency_ms': {
+            'p50': median * 1000,
+            'p90': float(np.percentile(samples, 90)) * 1000,
+            'p99': float(np.percentile(samples, 99)) * 1000,
+            'min': float(samples.min()) * 1000,
+            'max': float(samples.max()) * 1000,
+        },
+        'throughput': case.items(size) / median if median > 0 else float('inf'),
+        'peak_memory_mb': peak / 2**20,
+    }
+
+def run_suite(only: Optional[List[str]] = None, quick: bool = False,
+              repeats: Optional[int] = None) -> Dict:
+    results = []
+    for case in CASES:
+        if only and not any(case.name.startswith(prefix) for prefix in only):
+            continue
+        for size in (case.quick_sizes if quick else case.sizes):
+            result = measure(case, size, repeats)
+            results.append(result)
+            print(f"  {case.name:<36} {size:>8} {case.unit:<14} "
+                  f"p50 {result['latency_ms']['p50']:10.3f} ms  "
+                  f"p99 {result['latency_ms']['p99']:10.3f} ms  "
+                  f"{result['throughput']:14.1f} {case.unit.split()[-1]}/s  "
+                  f"{result['peak_memory_mb']:8.2f} MB")
+    return {
+        'version': RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Cases (matched by name and size) whose median latency exceeds the
+    baseline by more than `threshold` (0.10 = 10% slower)
+    """
+    base = {(r['case'], r['size']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        ref = base.get((result['case'], result['size']))
+        if ref is None:
+            continue
+        ratio = result['latency_ms']['p50'] / ref['latency_ms']['p50']
+        status = 'SLOWER' if ratio > 1 + threshold else 'ok'
+        print(f"  {result['case']:<36} {result['size']:>8}  "
+              f"{ref['latency_ms']['p50']:10.3f} → {result['latency_ms']['p50']:10.3f} ms  "
+              f"×{ratio:5.2f}  {status}")
+        if status != 'ok':
+            regressions.append({'case': result['case'], 'size': result['size'], 'ratio': ratio})
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Ψ-718 hot path benchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Run benchmarks")
+    run.add_argument('--only', nargs='+', metavar='CASE', help="Case name prefixes")
+    run.add_argument('--quick', action='store_true', help="Small sizes only")
+    run.add_argument('--repeats', type=int, default=None)
+    run.add_argument('--save', help="Write results JSON (use as a baseline)")
+    run.add_argument('--compare', help="Baseline JSON to compare against")
+    run.add_argument('--threshold', type=float, default=0.10,
+                     help="Allowed slowdown of median latency (default 0.10 = 10%%)")
+
+    commands.add_parser('list', help="List cases and sizes")
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for case in CASES:
+            print(f"  {case.name:<36} {case.unit:<14} sizes {case.sizes} (quick {case.quick_sizes})")
+        return
+
+    print("=" * 80)
+    print(f"BENCHMARK SUITE Ψ-718 | {'quick' if args.quick else 'full'}")
+    print("=" * 80)
+    current = run_suite(args.only, args.quick, args.repeats)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"\n✓ Results saved: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print("\n" + "=" * 80)
+        print(f"COMPARISON vs {args.compare} (threshold +{args.threshold:.0%})")
+        print("=" * 80)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n× {len(regressions)} regression(s)")
+            sys.exit(1)
+        print("\n✓ No regressions")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+# ═══════════════════════════════════════════════════════════════════
+# COLUMNAR EXPORT vφ.718
+# quantum_field_data/  =  manifest.json  +  one .npy file per column
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# Numeric columns are plain .npy files: np.load(..., mmap_mode='r')
+# reads them zero-copy. Chunks are appended in place; the .npy header
+# reserves room for the growing shape and is rewritten on each append.
+# Categorical strings are stored as uint8 codes, free text as JSON Lines.
+# ═══════════════════════════════════════════════════════════════════
+
+import argparse
+import json
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from quantum_core import (
+    PHI, GAMMA, PHI_SQUARED, FUNDAMENTAL_718, SCHUMANN, LUNAR,
+    GATCA_GATES, GATE_NAMES,
+)
+
+FORMAT_NAME = 'psi718-columnar'
+FORMAT_VERSION = 1
+MANIFEST = 'manifest.json'
+
+# Fixed .npy header size: magic (6) + version (2) + length (2) + dict
+_NPY_HEADER_BYTES = 128
+
+QUANTUM_STATES = ["TELEPORTATION_READY", "HIGH_COHERENCE", "SUPERPOSITION",
+                  "ENTANGLED", "DECOHERENT"]
+
+# Column layout of one decoded verse
+VERSE_CATEGORIES = {'quantum_state': QUANTUM_STATES}
+VERSE_TEXT = ('reference', 'text')
+VI_COLUMNS = {
+    'vi_magnitude': np.float64,
+    'vi_phase': np.float64,
+    'materialization_potential': np.float64,
+    'integration_error': np.float64,
+    'coherence_at_end': np.float64,
+    'teleport_ready': np.bool_,
+}
+
+# ═══════════════════════════════════════════════════════════════════
+# APPENDABLE .NPY COLUMNS
+# ═══════════════════════════════════════════════════════════════════
+
+def _npy_header(dtype: np.dtype, shape: tuple) -> bytes:
+    header = repr({'descr': np.lib.format.dtype_to_descr(dtype),
+                   'fortran_order': False, 'shape': shape})
+    body = _NPY_HEADER_BYTES - 10
+    if len(header) + 1 > body:
+        raise ValueError(f"Column header too long for shape {shape}")
+    header = header.ljust(body - 1) + '\n'
+    return (b'\x93NUMPY\x01\x00' + np.uint16(body).astype('<u2').tobytes()
+            + header.encode('latin1'))
+
+class NpyColumn:
+    """Single .npy file that grows along axis 0"""
+
+    def __init__(self, path: str, dtype: np.dtype, tail_shape: tuple = ()):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.tail_shape = tuple(tail_shape)
+        self.row_bytes = self.dtype.itemsize * int(np.prod(self.tail_shape))
+        self.rows = 0
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                np.lib.format.read_magic(f)
+                shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+            if dtype != self.dtype or tuple(shape[1:]) != self.tail_shape:
+                raise ValueError(f"{path}: stored {dtype}{shape} does not match {self.dtype}")
+            self.rows = shape[0]
+        else:
+            with open(path, 'wb') as f:
+                f.write(_npy_header(self.dtype, (0,) + self.tail_shape))
+
+    def append(self, values: np.ndarray):
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        with open(self.path, 'r+b') as f:
+            # Bytes past the header's shape are an interrupted append: overwrite them
+            f.seek(_NPY_HEADER_BYTES + self.rows * self.row_bytes)
+            f.write(values.tobytes())
+            f.truncate()
+            self.rows += len(values)
+            f.seek(0)
+            f.write(_npy_header(self.dtype, (self.rows,) + self.tail_shape))
+
+class TextColumn:
+    """Free-text column as JSON Lines (one string per row)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows = 0
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                self.rows = sum(1 for _ in f)
+
+    def append(self, values: List[str]):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(json.dumps(str(v), ensure_ascii=False) + '\n' for v in values)
+        self.rows += len(values)
+
+# ═══════════════════════════════════════════════════════════════════
+# WRITER / READER
+# ═══════════════════════════════════════════════════════════════════
+
+class ColumnarWriter:
+    """
+    Chunked writer for a columnar export directory
+
+    with ColumnarWriter('quantum_field_data') as out:
+        out.append({'magnitude': m, 'quantum_state': states, 'reference': refs})
+    """
+
+    def __init__(self, directory: str, categories: Optional[Dict[str, List[str]]] = None,
+                 text_columns: tuple = (), metadata: Optional[Dict] = None,
+                 mode: str = 'w'):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        manifest_path = os.path.join(directory, MANIFEST)
+
+        if mode == 'a' and os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        elif mode in ('w', 'a'):
+            for spec in _read_manifest(directory, missing_ok=True).get('columns', {}).values():
+                os.remove(os.path.join(directory, spec['file']))
+            self.manifest = {'format': FORMAT_NAME, 'version': FORMAT_VERSION,
+                             'rows': 0, 'columns': {}}
+        else:
+            raise ValueError(f"mode must be 'w' or 'a', got '{mode}'")
+
+        self.manifest.update(metadata or {})
+        self.categories = {name: list(values) for name, values in (categories or {}).items()}
+        for name, spec in self.manifest['columns'].items():
+            if spec['kind'] == 'category':
+                self.categories[name] = spec['categories']
+        self.text_columns = set(text_columns) | {
+            name for name, spec in self.manifest['columns'].items() if spec['kind'] == 'text'}
+        self.columns = {name: self._open(name, spec)
+                        for name, spec in self.manifest['columns'].items()}
+
+    def _open(self, name: str, spec: Dict):
+        path = os.path.join(self.directory, spec['file'])
+        if spec['kind'] == 'text':
+            return TextColumn(path)
+        return NpyColumn(path, np.dtype(spec['dtype']), tuple(spec['shape'][1:]))
+
+    def _encode(self, name: str, values) -> np.ndarray:
+        categories = self.categories[name]
+        lookup = {value: code for code, value in enumerate(categories)}
+        codes = []
+        for value in np.asarray(values).tolist():
+            if value not in lookup:
+                lookup[value] = len(categories)
+                categories.append(value)
+            codes.append(lookup[value])
+        if len(categories) > 256:
+            raise ValueError(f"Column '{name}' has more than 256 categories")
+        return np.asarray(codes, dtype=np.uint8)
+
+    def append(self, chunk: Dict[str, object]):
+        """Append equally long columns; the first chunk fixes the schema"""
+        lengths = {name: len(values) for name, values in chunk.items()}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"Column lengths differ: {lengths}")
+        if self.columns and set(chunk) != set(self.columns):
+            raise ValueError(f"Chunk columns {sorted(chunk)} != {sorted(self.columns)}")
+
+        for name, values in chunk.items():
+            if name in self.categories:
+                values, kind = self._encode(name, values), 'category'
+            elif name in self.text_columns:
+                kind = 'text'
+            else:
+                values, kind = np.asarray(values), 'numeric'
+                if values.dtype.kind not in 'biufc':
+                    raise TypeError(f"Column '{name}' is {values.dtype}; declare it as "
+                                    f"category or text")
+
+            if name not in self.columns:
+                spec = {'kind': kind}
+                if kind == 'text':
+                    spec['file'] = f"{name}.jsonl"
+                else:
+                    spec.update(file=f"{name}.npy", dtype=values.dtype.str,
+                                shape=[0] + list(values.shape[1:]))
+                self.manifest['columns'][name] = spec
+                self.columns[name] = self._open(name, spec)
+
+            self.columns[name].append(values)
+            spec = self.manifest['columns'][name]
+            if kind != 'text':
+                spec['shape'][0] = self.columns[name].rows
+            if kind == 'category':
+                spec['categories'] = self.categories[name]
+
+        self.manifest['rows'] += next(iter(lengths.values()), 0)
+        self._write_manifest()
+
+    def _write_manifest(self):
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def close(self):
+        self._write_manifest()
+
+    def __enter__(self) -> 'ColumnarWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _read_manifest(directory: str, missing_ok: bool = False) -> Dict:
+    path = os.path.join(directory, MANIFEST)
+    if missing_ok and not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format') != FORMAT_NAME:
+        raise ValueError(f"{directory} is not a {FORMAT_NAME} export")
+    return manifest
+
+def read_columns(directory: str, mmap: bool = True,
+                 decode_categories: bool = False) -> Dict[str, object]:
+    """
+    Load every column. Numeric columns are memory-mapped by default;
+    categorical columns stay as uint8 codes unless decode_categories.
+    """
+    manifest = _read_manifest(directory)
+    columns = {}
+    for name, spec in manifest['columns'].items():
+        path = os.path.join(directory, spec['file'])
+        if spec['kind'] == 'text':
+            with open(path, encoding='utf-8') as f:
+                columns[name] = [json.loads(line) for line in f]
+            continue
+        values = np.load(path, mmap_mode='r' if mmap else None)
+        if spec['kind'] == 'category' and decode_categories:
+            values = np.asarray(spec['categories'], dtype=object)[values]
+        columns[name] = values
+    return columns
+
+# ═══════════════════════════════════════════════════════════════════
+# DECODED VERSES ↔ COLUMNS ↔ quantum_field_data.json
+# ═══════════════════════════════════════════════════════════════════
+
+def verses_to_columns(results: List[Dict]) -> Dict[str, object]:
+    """
+    Columns from BiblicalDecoder.decode_verse results. The amplitude
+    only survives as printed there (4 decimals).
+    """
+    def amplitude(r: Dict, part: int) -> float:
+        real, imag = r['wave_function']['amplitude'][:-1].split(' ')
+        return float((real, imag)[part])
+
+    return {
+        'reference': [r['reference'] for r in results],
+        'text': [r['text'] for r in results],
+        'gate': np.array([r['gate'] for r in results], dtype=np.int32),
+        't': np.array([r['parameters']['t'] for r in results], dtype=np.float64),
+        'x': np.array([r['parameters']['x'] for r in results], dtype=np.float64),
+        'amplitude_real': np.array([amplitude(r, 0) for r in results]),
+        'amplitude_imag': np.array([amplitude(r, 1) for r in results]),
+        'magnitude': np.array([r['wave_function']['magnitude'] for r in results], dtype=np.float64),
+        'phase': np.array([r['wave_function']['phase'] for r in results], dtype=np.float64),
+        'coherence': np.array([float(r['wave_function']['coherence'][:-1]) / 100 for r in results]),
+        'quantum_state': [r['wave_function']['quantum_state'] for r in results],
+        **{key: np.array([r['vector_intention'][key] for r in results], dtype=dtype)
+           for key, dtype in VI_COLUMNS.items()},
+    }
+
+def export_metadata() -> Dict:
+    """Header fields of quantum_field_data.json"""
+    return {
+        'system': 'Ψ-718 Unified Field',
+        'constants': {
+            'phi': float(PHI),
+            'gamma': float(GAMMA),
+            '718_hz': FUNDAMENTAL_718,
+            'schumann': SCHUMANN,
+            'lunar': LUNAR
+        },
+        'dna_gates': GATCA_GATES,
+    }
+
+def write_verses(directory: str, results: List[Dict], mode: str = 'w'):
+    """decode_verse results → columnar export directory"""
+    with ColumnarWriter(directory, VERSE_CATEGORIES, VERSE_TEXT,
+                        export_metadata(), mode) as out:
+        out.append(verses_to_columns(results))
+
+def columns_to_json(directory: str, path: str):
+    """Columnar export → quantum_field_data.json layout"""
+    manifest = _read_manifest(directory)
+    c = read_columns(directory, mmap=True, decode_categories=True)
+    lists = {name: values if isinstance(values, list) else values.tolist()
+             for name, values in c.items()}
+    golden = {
+        'phi': round(PHI, 6),
+        'gamma': round(GAMMA, 6),
+        'phi_squared': round(PHI_SQUARED, 6),
+        '718_over_schumann': round(FUNDAMENTAL_718 / SCHUMANN, 2),
+        '718_over_gamma': round(FUNDAMENTAL_718 / GAMMA, 2)
+    }
+
+    verses = []
+    for i in range(manifest['rows']):
+        gate = lists['gate'][i]
+        verses.append({
+            'reference': lists['reference'][i],
+            'text': lists['text'][i][:100],
+            'gate': gate,
+            'gate_name': GATE_NAMES.get(gate, f"Gate-{GATCA_GATES.index(gate)+1}"),
+            'parameters': {'t': lists['t'][i], 'x': lists['x'][i]},
+            'wave_function': {
+                'amplitude': f"{lists['amplitude_real'][i]:.4f} {lists['amplitude_imag'][i]:+.4f}i",
+                'magnitude': lists['magnitude'][i],
+                'phase': lists['phase'][i],
+                'coherence': f"{lists['coherence'][i]*100:.2f}%",
+                'quantum_state': lists['quantum_state'][i]
+            },
+            'vector_intention': {
+                'vi_magnitude': lists['vi_magnitude'][i],
+                'vi_phase': lists['vi_phase'][i],
+                'materialization_potential': lists['materialization_potential'][i],
+                'integration_error': lists['integration_error'][i],
+                'gate': gate,
+                'coherence_at_end': lists['coherence_at_end'][i],
+                'teleport_ready': lists['teleport_ready'][i]
+            },
+            'golden_signatures': golden
+        })
+
+    export_data = {key: manifest[key] for key in ('system', 'constants', 'dna_gates') if key in manifest}
+    export_data['decoded_verses'] = verses
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(export_data, f, ensure_ascii=False, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar Ψ-718 export tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+    info = commands.add_parser('info', help="Show manifest summary")
+    info.add_argument('directory')
+    to_json = commands.add_parser('to-json', help="Convert to quantum_field_data.json layout")
+    to_json.add_argument('directory')
+    to_json.add_argument('output')
+    args = parser.parse_args()
+
+    if args.command == 'info':
+        manifest = _read_manifest(args.directory)
+        print(f"{args.directory}: {manifest['rows']} rows")
+        for name, spec in manifest['columns'].items():
+            print(f"  {name:<26} {spec['kind']:<9} {spec.get('dtype', '')}")
+    else:
+        columns_to_json(args.directory, args.output)
+        print(f"✓ Data exported: {args.output}")
+
+if __name__ == "__main__":
+    main()
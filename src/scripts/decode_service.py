@@ -0,0 +1,431 @@
+# ═══════════════════════════════════════════════════════════════════
+# DECODE SERVICE vφ.718
+# asyncio micro-batching server for decode_verse / calculate_psi
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# Protocol: newline-delimited JSON over TCP, any number of requests
+# in flight per connection, answers matched by "id":
+#   {"id": 1, "op": "decode", "reference": "John 1:1", "text": "..."}
+#   {"id": 2, "op": "psi", "t": 1.0, "x": 718.0, "gate": 0}
+#   {"id": 3, "op": "stats"}
+#
+# Concurrent requests are queued (bounded) and collected into batches
+# of at most max_batch, waiting at most max_wait_ms for a batch to
+# fill. Each batch runs through the vectorized field/VI paths on a
+# worker pool. A full queue answers "overloaded" after a short
+# admission timeout instead of growing latency without bound.
+# ═══════════════════════════════════════════════════════════════════
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from quantum_core import BiblicalDecoder
+
+# ═══════════════════════════════════════════════════════════════════
+# BATCH HANDLER (runs inside worker processes)
+# ═══════════════════════════════════════════════════════════════════
+
+_DECODER: Optional[BiblicalDecoder] = None
+
+def _decoder() -> BiblicalDecoder:
+    global _DECODER
+    if _DECODER is None:
+        _DECODER = BiblicalDecoder()
+    return _DECODER
+
+def process_batch(requests: List[Dict]) -> List[Dict]:
+    """
+    Answer a mixed batch of decode/psi requests, one result per request.
+    Malformed requests get an 'error' entry without failing the batch.
+    """
+    decoder = _decoder()
+    results: List[Optional[Dict]] = [None] * len(requests)
+    decode_idx, verses = [], []
+    psi_idx, psi_args = [], []
+
+    for i, req in enumerate(requests):
+        try:
+            if req.get('op') == 'decode':
+                verses.append((str(req.get('reference', '')), str(req['text'])))
+                decode_idx.append(i)
+            elif req.get('op') == 'psi':
+                # Gate wraps like calculate_psi; reduce here so the batch array stays int64
+                gate = int(req.get('gate', 0)) % 18
+                t, x = float(req['t']), float(req['x'])
+                # json.loads accepts NaN/Infinity; answers must stay strict JSON
+                if not (math.isfinite(t) and math.isfinite(x)):
+                    raise ValueError(f"non-finite t/x: {t!r}, {x!r}")
+                psi_args.append((t, x, gate))
+                psi_idx.append(i)
+            else:
+                results[i] = {'error': f"unknown op '{req.get('op')}'"}
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            results[i] = {'error': f"bad request: {e!r}"}
+
+    for i, result in zip(decode_idx, decoder.decode_verses_batch(verses)):
+        results[i] = {'result': result}
+
+    if psi_args:
+        t, x, gate = (np.array(column) for column in zip(*psi_args))
+        psi = decoder.field.calculate_psi_batch(t, x, gate)
+        columns = {key: values.tolist() for key, values in psi.items() if key != 'amplitude'}
+        for j, i in enumerate(psi_idx):
+            amplitude = psi['amplitude'][j]
+            results[i] = {'result': {'amplitude': [amplitude.real, amplitude.imag],
+                                     **{key: values[j] for key, values in columns.items()}}}
+    return results
+
+# ═══════════════════════════════════════════════════════════════════
+# MICRO-BATCHER
+# ═══════════════════════════════════════════════════════════════════
+
+class Overloaded(Exception):
+    """Request queue stayed full for the whole admission timeout"""
+
+class MicroBatcher:
+    """
+    Collects submitted items into batches for `handler(List) -> List`,
+    run on `executor` with at most `max_inflight` batches at once
+    """
+
+    def __init__(self, handler: Callable[[List], List], max_batch: int = 256,
+                 max_wait_ms: float = 5.0, max_queue: int = 4096,
+                 admission_timeout_ms: float = 50.0, executor: Optional[Executor] = None,
+                 max_inflight: int = 1):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.admission_timeout = admission_timeout_ms / 1000
+        self.executor = executor
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.inflight = asyncio.Semaphore(max_inflight)
+        self.stats = {'requests': 0, 'rejected': 0, 'batches': 0, 'batched_items': 0,
+                      'max_batch_seen': 0}
+        self._task: Optional[asyncio.Task] = None
+        self._batches: set = set()
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._collect())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    async def submit(self, item) -> object:
+        future = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(self.queue.put((item, future)), self.admission_timeout)
+        except asyncio.TimeoutError:
+            self.stats['rejected'] += 1
+            raise Overloaded()
+        self.stats['requests'] += 1
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self.inflight.acquire()
+            task = loop.create_task(self._run(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: List[Tuple[object, asyncio.Future]]):
+        try:
+            items = [item for item, _ in batch]
+            self.stats['batches'] += 1
+            self.stats['batched_items'] += len(items)
+            self.stats['max_batch_seen'] = max(self.stats['max_batch_seen'], len(items))
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, self.handler, items)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self.inflight.release()
+
+# ═══════════════════════════════════════════════════════════════════
+# TCP SERVICE
+# ═══════════════════════════════════════════════════════════════════
+
+class DecodeService:
+    """
+    Localhost JSON-lines server in front of a MicroBatcher.
+    workers=0 runs batches in the event loop's default thread pool.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 7180, max_batch: int = 256,
+                 max_wait_ms: float = 5.0, max_queue: int = 4096,
+                 admission_timeout_ms: float = 50.0, workers: Optional[int] = None,
+                 max_pending_per_connection: int = 1024):
+        self.host = host
+        self.port = port
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.executor = ProcessPoolExecutor(self.workers) if self.workers else None
+        self.batcher_options = dict(max_batch=max_batch, max_wait_ms=max_wait_ms,
+                                    max_queue=max_queue, admission_timeout_ms=admission_timeout_ms,
+                                    max_inflight=max(self.workers, 1))
+        self.max_pending = max_pending_per_connection
+        self.batcher: Optional[MicroBatcher] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._connections: set = set()
+
+    async def start(self) -> Tuple[str, int]:
+        self.batcher = MicroBatcher(process_batch, executor=self.executor, **self.batcher_options)
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle, self.host, self.port,
+                                                 limit=1 << 20)
+        self.host, self.port = self.server.sockets[0].getsockname()[:2]
+        return self.host, self.port
+
+    async def close(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+        if self._connections:
+            # Connections closed by their clients finish on their own
+            _, still_open = await asyncio.wait(self._connections, timeout=1.0)
+            for task in still_open:
+                task.cancel()
+            await asyncio.gather(*still_open, return_exceptions=True)
+        if self.batcher:
+            await self.batcher.stop()
+        if self.executor:
+            self.executor.shutdown(wait=True)
+
+    async def _answer(self, request: Dict) -> Dict:
+        if request.get('op') == 'stats':
+            return {'result': {**self.batcher.stats, 'queue_depth': self.batcher.queue.qsize()}}
+        try:
+            return await self.batcher.submit(request)
+        except Overloaded:
+            return {'error': 'overloaded'}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Per-connection cap: stop reading (TCP backpressure) while too many are pending
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        connection.add_done_callback(self._connections.discard)
+        pending = asyncio.Semaphore(self.max_pending)
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(line: bytes):
+            try:
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as e:
+                    request, response = {}, {'error': f"bad json: {e}"}
+                else:
+                    try:
+                        response = await self._answer(request)
+                    except Exception as e:
+                        # A failed batch must still answer every caller in it
+                        response = {'error': f"internal error: {e!r}"}
+                response['id'] = request.get('id')
+                async with write_lock:
+                    writer.write(json.dumps(response, ensure_ascii=False).encode() + b'\n')
+                    await writer.drain()
+            finally:
+                pending.release()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await pending.acquire()
+                task = asyncio.get_running_loop().create_task(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+# ═══════════════════════════════════════════════════════════════════
+# CLIENT + LOCAL LOAD TEST
+# ═══════════════════════════════════════════════════════════════════
+
+class DecodeClient:
+    """Pipelined client: many concurrent requests over one connection"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader, self.writer = reader, writer
+        self.waiting: Dict[int, asyncio.Future] = {}
+        self.next_id = 0
+        self._reader_task = asyncio.get_running_loop().create_task(self._read())
+
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1', port: int = 7180) -> 'DecodeClient':
+        reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        return cls(reader, writer)
+
+    async def _read(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self.waiting.pop(response.get('id'), None)
+            if future and not future.done():
+                future.set_result(response)
+        for future in self.waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError("connection closed"))
+
+    async def request(self, payload: Dict) -> Dict:
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[self.next_id] = future
+        self.writer.write(json.dumps({**payload, 'id': self.next_id}, ensure_ascii=False).encode() + b'\n')
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self._reader_task.cancel()
+
+async def load_test(requests: int = 2000, concurrency: int = 128, connections: int = 4,
+                    **service_options) -> Dict:
+    """Start a service on a free localhost port and hammer it with decode requests"""
+    service = DecodeService(port=0, **service_options)
+    host, port = await service.start()
+    clients = [await DecodeClient.connect(host, port) for _ in range(connections)]
+    latencies, errors = [], 0
+    gate = asyncio.Semaphore(concurrency)
+    rng = np.random.default_rng(718)
+    letters = list("AĄBCĆDEĘFGHIJKLŁMNŃOÓPRSŚTUWYZŹŻ ")
+
+    async def one(i: int):
+        nonlocal errors
+        text = ''.join(rng.choice(letters, size=int(rng.integers(10, 80))))
+        async with gate:
+            start = time.perf_counter()
+            response = await clients[i % connections].request(
+                {'op': 'decode', 'reference': f"Load {i}", 'text': text})
+            latencies.append(time.perf_counter() - start)
+            if 'error' in response:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    wall = time.perf_counter() - start
+    stats = (await clients[0].request({'op': 'stats'}))['result']
+
+    for client in clients:
+        await client.close()
+    await service.close()
+
+    ms = np.array(latencies) * 1000
+    return {
+        'requests': requests,
+        'errors': errors,
+        'wall_seconds': wall,
+        'requests_per_second': requests / wall,
+        'latency_ms': {p: float(np.percentile(ms, q)) for p, q in
+                       (('p50', 50), ('p90', 90), ('p99', 99), ('max', 100))},
+        'mean_batch': stats['batched_items'] / max(stats['batches'], 1),
+        'service': stats,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Ψ-718 micro-batching decode service")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def service_args(p):
+        p.add_argument('--max-batch', type=int, default=256)
+        p.add_argument('--max-wait-ms', type=float, default=5.0)
+        p.add_argument('--max-queue', type=int, default=4096)
+        p.add_argument('--admission-timeout-ms', type=float, default=50.0)
+        p.add_argument('--workers', type=int, default=None,
+                       help="Worker processes (default: CPU count, 0 = threads)")
+
+    serve = commands.add_parser('serve', help="Run the service")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=7180)
+    service_args(serve)
+
+    load = commands.add_parser('loadtest', help="Local load test against an in-process service")
+    load.add_argument('--requests', type=int, default=2000)
+    load.add_argument('--concurrency', type=int, default=128)
+    load.add_argument('--connections', type=int, default=4)
+    service_args(load)
+    args = parser.parse_args()
+
+    options = dict(max_batch=args.max_batch, max_wait_ms=args.max_wait_ms,
+                   max_queue=args.max_queue, admission_timeout_ms=args.admission_timeout_ms,
+                   workers=args.workers)
+
+    if args.command == 'serve':
+        async def serve_forever():
+            service = DecodeService(args.host, args.port, **options)
+            host, port = await service.start()
+            print(f"✓ Ψ-718 decode service on {host}:{port} "
+                  f"(batch ≤ {args.max_batch}, wait ≤ {args.max_wait_ms} ms, {service.workers} workers)")
+            try:
+                await service.server.serve_forever()
+            finally:
+                await service.close()
+        try:
+            asyncio.run(serve_forever())
+        except KeyboardInterrupt:
+            pass
+    else:
+        report = asyncio.run(load_test(args.requests, args.concurrency, args.connections, **options))
+        print("=" * 70)
+        print(f"LOAD TEST | {report['requests']} requests | {report['errors']} errors")
+        print("=" * 70)
+        print(f"  Throughput: {report['requests_per_second']:.1f} req/s")
+        print("  Latency: " + ", ".join(f"{k} {v:.2f} ms" for k, v in report['latency_ms'].items()))
+        print(f"  Mean batch: {report['mean_batch']:.1f} "
+              f"(max {report['service']['max_batch_seen']}, {report['service']['batches']} batches)")
+        print("=" * 70)
+
+if __name__ == "__main__":
+    main()
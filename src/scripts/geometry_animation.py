@@ -0,0 +1,265 @@
+# ═══════════════════════════════════════════════════════════════════
+# GEOMETRY ANIMATION vφ.718
+# Parallel frame renderer for the SacredGeometry unified field
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# Pentagram, helix, Vector M and all 18 gates are computed once. Each
+# worker builds one Agg figure and reuses its artists: per frame only
+# the camera (rotate) or the camera plus gate populations |ψᵢ(t)|² from
+# evolve_gate_state (evolve) change. Frame ranges are rendered in a
+# process pool and streamed to numbered PNGs or a raw rgb24 pipe:
+#
+#   python geometry_animation.py png frames/ --frames 1800
+#   python geometry_animation.py raw - --mode evolve | \
+#       ffmpeg -f rawvideo -pix_fmt rgb24 -s 1280x720 -r 30 -i - field.mp4
+# ═══════════════════════════════════════════════════════════════════
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+import numpy as np
+
+from system_unification import (
+    SacredGeometry, GATCA_GATES, GATE_NAMES, PHI, GAMMA,
+    gate_hamiltonian, evolve_gate_state,
+)
+
+MODES = ('rotate', 'evolve')
+
+@dataclass
+class SceneGeometry:
+    """Static scene arrays, shared by every frame"""
+    pentagram: np.ndarray       # (13, 3): outer, inner, Sun, Earth, Man
+    strand1: np.ndarray
+    strand2: np.ndarray
+    gates: np.ndarray           # (18, 3) on strand 1
+    vector_m: np.ndarray
+
+def build_geometry(turns: int = 2) -> SceneGeometry:
+    geometry = SacredGeometry()
+    s1, s2 = geometry.dna_helix(turns=turns)
+    return SceneGeometry(geometry.pentagram_points(), s1, s2,
+                         geometry.gate_points(s1), geometry.vector_m())
+
+def gate_populations(frames: int, duration: float = 5.0) -> np.ndarray:
+    """
+    |ψᵢ(t)|² for ψ₀ = (|Alpha⟩ + |Theta⟩ + |Sigma⟩)/√3, one row per frame
+    """
+    psi0 = np.zeros(len(GATCA_GATES), dtype=complex)
+    psi0[[0, 7, 17]] = 1 / np.sqrt(3)
+    times = np.linspace(0, duration, frames)
+    probabilities, _, _ = evolve_gate_state(gate_hamiltonian(len(GATCA_GATES)), psi0, times)
+    return probabilities
+
+@dataclass
+class AnimationSpec:
+    """Everything a worker needs to render any frame"""
+    frames: int
+    mode: str = 'rotate'
+    width: int = 1280
+    height: int = 720
+    dpi: int = 100
+    rotations: float = 1.0
+    elevation: float = 20.0
+    duration: float = 5.0      # evolution time covered by the animation
+
+    def camera(self, frame: int) -> Tuple[float, float]:
+        """(elev, azim): full turns over the animation, slow elevation sway"""
+        phase = frame / self.frames
+        return (self.elevation + 10 * np.sin(2 * np.pi * phase),
+                -60 + 360 * self.rotations * phase)
+
+# ═══════════════════════════════════════════════════════════════════
+# FRAME RENDERER (one per worker process)
+# ═══════════════════════════════════════════════════════════════════
+
+class FrameRenderer:
+    """
+    One Agg figure with artists created once; render(frame) only moves
+    the camera and updates gate sizes/title before drawing
+    """
+
+    def __init__(self, spec: AnimationSpec, geometry: SceneGeometry,
+                 populations: Optional[np.ndarray] = None):
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from mpl_toolkits.mplot3d import Axes3D  # registers the '3d' projection
+
+        self.spec = spec
+        self.populations = populations
+        self.fig = Figure(figsize=(spec.width / spec.dpi, spec.height / spec.dpi), dpi=spec.dpi)
+        self.canvas = FigureCanvasAgg(self.fig)
+        ax = self.ax = self.fig.add_subplot(111, projection='3d')
+
+        p = geometry.pentagram
+        ax.scatter(p[:5, 0], p[:5, 1], p[:5, 2], c='gold', s=100, marker='o', label='Pentagram')
+        ax.scatter(p[10, 0], p[10, 1], p[10, 2], c='red', s=200, marker='*', label='Sun')
+        ax.scatter(p[11, 0], p[11, 1], p[11, 2], c='blue', s=200, marker='v', label='Earth')
+        ax.scatter(p[12, 0], p[12, 1], p[12, 2], c='green', s=150, marker='^', label='Man')
+
+        s1, s2 = geometry.strand1, geometry.strand2
+        ax.plot(s1[:, 0], s1[:, 1], s1[:, 2], 'b-', alpha=0.6, linewidth=2, label='DNA Strand 1')
+        ax.plot(s2[:, 0], s2[:, 1], s2[:, 2], 'r-', alpha=0.6, linewidth=2, label='DNA Strand 2')
+
+        M = geometry.vector_m
+        ax.quiver(0, 0, 0, M[0], M[1], M[2], length=1.5, normalize=True,
+                  color='purple', linewidth=3, arrow_length_ratio=0.3, label='Vector M')
+
+        g = geometry.gates
+        self.gates = ax.scatter(g[:, 0], g[:, 1], g[:, 2], c='cyan', s=50, marker='o',
+                                edgecolors='darkcyan', label=f'{len(g)} GATCA Gates')
+
+        ax.set_xlabel('X (Sun)')
+        ax.set_ylabel('Y (Earth)')
+        ax.set_zlabel('Z (Consciousness)')
+        ax.legend(loc='upper left')
+        self.title = ax.set_title(f'Ψ-718 Unified Field | γ = {GAMMA:.6f} | φ = {PHI:.6f}')
+        # Fixed limits: autoscaling would otherwise shift with marker sizes
+        ax.set_xlim(-1.1, 1.1)
+        ax.set_ylim(-1.1, 1.1)
+        ax.set_zlim(-1.0, max(2.0, float(s1[:, 2].max())))
+
+    def render(self, frame: int) -> np.ndarray:
+        """Draw one frame, returning an (height, width, 3) uint8 view"""
+        elev, azim = self.spec.camera(frame)
+        self.ax.view_init(elev=elev, azim=azim)
+        if self.populations is not None:
+            probs = self.populations[frame]
+            self.gates.set_sizes(30 + 600 * probs)
+            top = int(np.argmax(probs))
+            t = self.spec.duration * frame / max(self.spec.frames - 1, 1)
+            self.title.set_text(f'Ψ-718 Unified Field | t = {t:.3f} | '
+                                f'{GATE_NAMES.get(GATCA_GATES[top], f"Gate-{top+1}")} '
+                                f'|ψ|² = {probs[top]:.3f}')
+        self.canvas.draw()
+        return np.asarray(self.canvas.buffer_rgba())[:, :, :3]
+
+_RENDERER: Optional[FrameRenderer] = None
+
+def _init_worker(spec: AnimationSpec, geometry: SceneGeometry,
+                 populations: Optional[np.ndarray]):
+    global _RENDERER
+    _RENDERER = FrameRenderer(spec, geometry, populations)
+
+def render_png_range(start: int, stop: int, out_dir: str) -> int:
+    """Write frames [start, stop) as frame_NNNNN.png inside the worker"""
+    from matplotlib.image import imsave
+    for frame in range(start, stop):
+        imsave(os.path.join(out_dir, f'frame_{frame:05d}.png'), _RENDERER.render(frame))
+    return stop - start
+
+def render_raw_range(start: int, stop: int) -> bytes:
+    """Frames [start, stop) as consecutive rgb24 images"""
+    return b''.join(_RENDERER.render(frame).tobytes() for frame in range(start, stop))
+
+# ═══════════════════════════════════════════════════════════════════
+# DRIVER
+# ═══════════════════════════════════════════════════════════════════
+
+def frame_ranges(frames: int, chunk: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, frames, chunk):
+        yield start, min(start + chunk, frames)
+
+def render_animation(spec: AnimationSpec, output: str, fmt: str = 'png',
+                     workers: Optional[int] = None, chunk: int = 16) -> dict:
+    """
+    Render spec.frames frames to a directory of PNGs (fmt='png') or an
+    rgb24 stream (fmt='raw', output '-' = stdout). Raw chunks are written
+    in frame order with at most 2·workers chunks in flight.
+    workers=0 renders in-process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    geometry = build_geometry()
+    populations = gate_populations(spec.frames, spec.duration) if spec.mode == 'evolve' else None
+    start_time = time.perf_counter()
+
+    if fmt == 'png':
+        os.makedirs(output, exist_ok=True)
+        task, sink = render_png_range, None
+        args = (output,)
+    elif fmt == 'raw':
+        task, args = render_raw_range, ()
+        sink: Optional[BinaryIO] = sys.stdout.buffer if output == '-' else open(output, 'wb')
+    else:
+        raise ValueError(f"Unknown frame format '{fmt}'")
+
+    def consume(result):
+        if sink is not None:
+            sink.write(result)
+
+    try:
+        if workers == 0:
+            _init_worker(spec, geometry, populations)
+            for start, stop in frame_ranges(spec.frames, chunk):
+                consume(task(start, stop, *args))
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(spec, geometry, populations)) as pool:
+                pending = deque()
+                for start, stop in frame_ranges(spec.frames, chunk):
+                    pending.append(pool.submit(task, start, stop, *args))
+                    if len(pending) >= 2 * workers:
+                        consume(pending.popleft().result())
+                while pending:
+                    consume(pending.popleft().result())
+    finally:
+        if sink is not None:
+            if output == '-':
+                sink.flush()
+            else:
+                sink.close()
+
+    wall = time.perf_counter() - start_time
+    return {
+        'frames': spec.frames,
+        'workers': workers,
+        'wall_seconds': wall,
+        'frames_per_second': spec.frames / wall if wall > 0 else 0.0,
+        'size': f'{spec.width}x{spec.height}',
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Ψ-718 unified field animation frames")
+    parser.add_argument('format', choices=['png', 'raw'],
+                        help="png: numbered frames in a directory; raw: rgb24 stream")
+    parser.add_argument('output', help="Directory (png) or file / '-' for stdout (raw)")
+    parser.add_argument('--frames', type=int, default=360)
+    parser.add_argument('--mode', choices=MODES, default='rotate',
+                        help="rotate: camera only; evolve: camera + gate populations |ψᵢ(t)|²")
+    parser.add_argument('--size', default='1280x720', help="WIDTHxHEIGHT in pixels")
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--rotations', type=float, default=1.0)
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help="Evolution time spanned by the animation (evolve mode)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: CPU count, 0 = in-process)")
+    parser.add_argument('--chunk', type=int, default=16, help="Frames per task")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    spec = AnimationSpec(args.frames, args.mode, width, height, args.dpi,
+                         args.rotations, duration=args.duration)
+    report = render_animation(spec, args.output, args.format, args.workers, args.chunk)
+
+    # Progress goes to stderr so a raw stream on stdout stays clean
+    print(f"✓ {report['frames']} frames ({report['size']}, {args.mode}) → {args.output} | "
+          f"{report['wall_seconds']:.2f} s, {report['frames_per_second']:.1f} frames/s, "
+          f"{report['workers']} workers", file=sys.stderr)
+    if args.format == 'raw' and args.output != '-':
+        print(f"  ffmpeg -f rawvideo -pix_fmt rgb24 -s {report['size']} -r 30 "
+              f"-i {args.output} field.mp4", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
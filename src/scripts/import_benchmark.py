@@ -0,0 +1,84 @@
+# ═══════════════════════════════════════════════════════════════════
+# IMPORT BENCHMARK vφ.718
+# Cold import time of the compute surface vs. the full plotting stack
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# Every sample runs in a fresh interpreter, which is exactly what a
+# spawned pool worker or a short CLI invocation pays.
+# ═══════════════════════════════════════════════════════════════════
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+import numpy as np
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Measured inside the child so interpreter startup is excluded
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = sorted({{name.split('.')[0] for name in sys.modules}}
+               & {{'matplotlib', 'mpl_toolkits', 'scipy'}})
+print(json.dumps({{'seconds': elapsed, 'heavy_modules': heavy}}))
+"""
+
+TARGETS = {
+    'numpy': "import numpy",
+    'quantum_core': "import quantum_core",
+    'system_unification': "import system_unification",
+    'full_stack': "import system_unification, matplotlib.pyplot, scipy.integrate, scipy.io.wavfile",
+}
+
+def measure(statement: str, repeats: int = 5) -> Dict:
+    """Import statement in `repeats` fresh interpreters"""
+    samples: List[float] = []
+    heavy: List[str] = []
+    for _ in range(repeats):
+        out = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(statement=statement)],
+            cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        probe = json.loads(out.strip().splitlines()[-1])
+        samples.append(probe['seconds'])
+        heavy = probe['heavy_modules']
+    return {
+        'median_ms': float(np.median(samples) * 1000),
+        'min_ms': float(np.min(samples) * 1000),
+        'max_ms': float(np.max(samples) * 1000),
+        'heavy_modules': heavy
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold import time per entry point")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--json', help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = {name: measure(statement, args.repeats) for name, statement in TARGETS.items()}
+
+    print("=" * 70)
+    print(f"IMPORT TIME | {args.repeats} fresh interpreters per target")
+    print("=" * 70)
+    for name, r in results.items():
+        heavy = ', '.join(r['heavy_modules']) or '-'
+        print(f"  {name:<20} {r['median_ms']:9.1f} ms  (min {r['min_ms']:.1f}, "
+              f"max {r['max_ms']:.1f})  heavy: {heavy}")
+    print("=" * 70)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Results saved: {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# ═══════════════════════════════════════════════════════════════════
+# INSTRUMENTATION vφ.718
+# Opt-in in-process metrics registry (counters, summaries, timers)
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# Hooks in system_unification.py are guarded by `if metrics.ENABLED:`,
+# so a disabled registry costs one attribute lookup per hook.
+#
+#   import instrumentation as metrics
+#   metrics.enable()
+#   ...
+#   metrics.write('metrics.prom')      # or .json
+# ═══════════════════════════════════════════════════════════════════
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, Optional, Tuple
+
+PREFIX = 'psi718_'
+
+ENABLED = False
+
+HELP = {
+    'zeta_evaluations_total': "ZetaRiemann.critical_line calls",
+    'zeta_terms_summed_total': "Dirichlet series terms summed by critical_line",
+    'psi_evaluations_total': "ConsciousnessField.calculate_psi calls",
+    'vi_integrand_calls': "Integrand evaluations per VectorIntention.calculate_vi",
+    'audio_samples_synthesized_total': "Samples synthesized, per render and gate",
+    'wav_write_seconds': "Time spent writing WAV files",
+    'stage_seconds': "Wall time per main() stage",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+class MetricsRegistry:
+    """Counters and summaries keyed by (name, labels)"""
+
+    def __init__(self):
+        self.counters: Dict[Tuple[str, LabelKey], float] = {}
+        self.summaries: Dict[Tuple[str, LabelKey], Dict[str, float]] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, object]) -> Tuple[str, LabelKey]:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = self._key(name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = self._key(name, labels)
+        s = self.summaries.get(key)
+        if s is None:
+            self.summaries[key] = {'count': 1, 'sum': value, 'min': value, 'max': value}
+        else:
+            s['count'] += 1
+            s['sum'] += value
+            s['min'] = min(s['min'], value)
+            s['max'] = max(s['max'], value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def merge(self, other: 'MetricsRegistry'):
+        for key, value in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, s in other.summaries.items():
+            mine = self.summaries.get(key)
+            if mine is None:
+                self.summaries[key] = dict(s)
+            else:
+                mine['count'] += s['count']
+                mine['sum'] += s['sum']
+                mine['min'] = min(mine['min'], s['min'])
+                mine['max'] = max(mine['max'], s['max'])
+
+    def reset(self):
+        self.counters.clear()
+        self.summaries.clear()
+
+    def to_dict(self) -> Dict:
+        def entries(table, value):
+            out = {}
+            for (name, labels), v in sorted(table.items()):
+                out.setdefault(name, []).append({'labels': dict(labels), **value(v)})
+            return out
+        return {
+            'counters': entries(self.counters, lambda v: {'value': v}),
+            'summaries': entries(self.summaries, lambda s: dict(s)),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (summaries as _count/_sum)"""
+        def fmt(labels: LabelKey) -> str:
+            return '{' + ','.join(f'{k}="{v}"' for k, v in labels) + '}' if labels else ''
+
+        def num(value: float) -> str:
+            return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+        lines = []
+        seen = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {PREFIX}{name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {PREFIX}{name} counter")
+            lines.append(f"{PREFIX}{name}{fmt(labels)} {num(value)}")
+        for (name, labels), s in sorted(self.summaries.items()):
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {PREFIX}{name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {PREFIX}{name} summary")
+            lines.append(f"{PREFIX}{name}_count{fmt(labels)} {num(s['count'])}")
+            lines.append(f"{PREFIX}{name}_sum{fmt(labels)} {num(s['sum'])}")
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = MetricsRegistry()
+
+# ═══════════════════════════════════════════════════════════════════
+# MODULE-LEVEL API (always targets the current REGISTRY)
+# ═══════════════════════════════════════════════════════════════════
+
+def enable(flag: bool = True):
+    global ENABLED
+    ENABLED = flag
+
+def inc(name: str, value: float = 1, **labels):
+    REGISTRY.inc(name, value, **labels)
+
+def observe(name: str, value: float, **labels):
+    REGISTRY.observe(name, value, **labels)
+
+def timer(name: str, **labels):
+    return REGISTRY.timer(name, **labels)
+
+def timed(name: str, **labels):
+    """timer() when enabled, otherwise a no-op context"""
+    return REGISTRY.timer(name, **labels) if ENABLED else nullcontext()
+
+@contextmanager
+def scoped(enabled: Optional[bool] = None) -> Iterator[MetricsRegistry]:
+    """
+    Collect into a fresh registry for the duration of the block, e.g. in
+    a pool worker; merge the yielded registry into the parent's afterwards.
+    """
+    global REGISTRY, ENABLED
+    previous, previous_enabled = REGISTRY, ENABLED
+    REGISTRY = MetricsRegistry()
+    if enabled is not None:
+        ENABLED = enabled
+    try:
+        yield REGISTRY
+    finally:
+        REGISTRY, ENABLED = previous, previous_enabled
+
+def write(path: str, fmt: Optional[str] = None):
+    """Export to JSON or Prometheus text (by fmt, else by extension)"""
+    fmt = fmt or ('json' if path.endswith('.json') else 'prometheus')
+    text = REGISTRY.to_json() if fmt == 'json' else REGISTRY.to_prometheus()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
@@ -0,0 +1,42 @@
+# ═══════════════════════════════════════════════════════════════════
+# QUANTUM CORE vφ.718
+# Headless compute-only surface of system_unification.py
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# Importing this module loads numpy only - no matplotlib, no scipy.
+# Use it in worker processes and short CLI runs that never plot or
+# write audio. (VectorIntention.calculate_vi still pulls in
+# scipy.integrate on first call; calculate_vi_batch does not.)
+# ═══════════════════════════════════════════════════════════════════
+
+from system_unification import (
+    # Constants
+    PHI, GAMMA, PHI_SQUARED, FUNDAMENTAL_718, SCHUMANN, LUNAR,
+    MTDNA_LENGTH, RESONANCE_THRESHOLD, GATCA_GATES, GATE_NAMES,
+    HEBREW_GEMATRIA, GEMATRIA_TABLE,
+    # Field
+    ZetaRiemann, WaveFunction, ConsciousnessField, VectorIntention,
+    BiblicalDecoder,
+    # Hebrew text analysis
+    hebrew_gematria, hebrew_gematria_batch, gematria_values, GematriaIndex,
+    fractal_analysis_718, fractal_analysis_718_batch, fractal_profile_718,
+    sliding_distinct_counts,
+    hamilton_eigenvalue_correlation, hamilton_eigenvalue_correlation_batch,
+)
+
+HEAVY_MODULES = ('matplotlib', 'mpl_toolkits', 'scipy')
+
+__all__ = [
+    'PHI', 'GAMMA', 'PHI_SQUARED', 'FUNDAMENTAL_718', 'SCHUMANN', 'LUNAR',
+    'MTDNA_LENGTH', 'RESONANCE_THRESHOLD', 'GATCA_GATES', 'GATE_NAMES',
+    'HEBREW_GEMATRIA', 'GEMATRIA_TABLE',
+    'ZetaRiemann', 'WaveFunction', 'ConsciousnessField', 'VectorIntention',
+    'BiblicalDecoder',
+    'hebrew_gematria', 'hebrew_gematria_batch', 'gematria_values', 'GematriaIndex',
+    'fractal_analysis_718', 'fractal_analysis_718_batch', 'fractal_profile_718',
+    'sliding_distinct_counts',
+    'hamilton_eigenvalue_correlation', 'hamilton_eigenvalue_correlation_batch',
+]
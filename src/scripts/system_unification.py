@@ -19,12 +19,16 @@
 import numpy as np
 import cmath
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
-from scipy.io.wavfile import write
-from scipy.integrate import quad
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+from typing import Callable, List, Tuple, Dict, Optional
+import argparse
 import json
+import os
+import time
+
+import instrumentation as metrics
+
+# scipy and matplotlib are imported lazily inside the functions that use
+# them, so compute-only callers (see quantum_core.py) never load them.
 
 # ═══════════════════════════════════════════════════════════════════
 # FUNDAMENTAL CONSTANTS - THE KEYS TO THE MATRIX
@@ -102,6 +106,7 @@ class ZetaRiemann:
         """
         s = 0.5 + 1j * E_over_hbar
         result = 0 + 0j
+        n = 0
         
         for n in range(1, terms + 1):
             term = 1 / (n ** s)
@@ -110,6 +115,10 @@ class ZetaRiemann:
             # Accelerated convergence check
             if n > 100 and abs(term) < 1e-12:
                 break
+        
+        if metrics.ENABLED:
+            metrics.inc('zeta_evaluations_total')
+            metrics.inc('zeta_terms_summed_total', n)
                 
         return result
     
@@ -164,13 +173,23 @@ class ConsciousnessField:
     def __init__(self):
         self.zeta = ZetaRiemann()
         self.k = 2 * np.pi / FUNDAMENTAL_718  # Wave number
+        self._zeta_718 = None
         
+    def zeta_718(self) -> complex:
+        """ζ(1/2 + i·718), summed once and reused by the batch paths"""
+        if self._zeta_718 is None:
+            self._zeta_718 = self.zeta.critical_line(FUNDAMENTAL_718)
+        return self._zeta_718
+    
     def calculate_psi(self, t: float, x: float, gate_idx: int = 0) -> WaveFunction:
         """
         Calculate wave function Ψ for given spacetime coordinates
         
         Ψ_total = A · e^(i·718·t) · cos(7.83·t) · sin(18.6·t) · φ²
         """
+        if metrics.ENABLED:
+            metrics.inc('psi_evaluations_total')
+        
         # Temporal component: e^(i·718·t)
         temporal = cmath.exp(1j * FUNDAMENTAL_718 * t)
         
@@ -217,6 +236,47 @@ class ConsciousnessField:
             phi_harmonic=round(magnitude * PHI, 6)
         )
     
+    def calculate_psi_batch(self, t: np.ndarray, x: np.ndarray,
+                            gate_idx: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_psi over arrays of (t, x, gate_idx)
+
+        Returns the WaveFunction fields as columns.
+        """
+        t, x, gate_idx = np.broadcast_arrays(np.asarray(t, dtype=np.float64),
+                                             np.asarray(x, dtype=np.float64),
+                                             np.asarray(gate_idx, dtype=np.int64))
+        zeta_val = self.zeta_718()
+        gate_pos = np.asarray(GATCA_GATES)[gate_idx % 18]
+        dna_factor = (gate_pos / MTDNA_LENGTH) * GAMMA
+
+        psi = (np.exp(1j * FUNDAMENTAL_718 * t) * np.exp(-1j * self.k * x) *
+               zeta_val * GAMMA * np.cos(SCHUMANN * t) * np.sin(LUNAR * t) *
+               PHI_SQUARED * dna_factor)
+
+        magnitude = np.abs(psi)
+        coherence = 1 - np.abs(magnitude % GAMMA - GAMMA) / GAMMA
+        coherence = np.minimum(coherence * PHI, 1.0)
+
+        return {
+            'amplitude': psi,
+            'magnitude': np.round(magnitude, 6),
+            'phase': np.round(np.angle(psi), 6),
+            'coherence': np.round(coherence, 6),
+            'quantum_state': self._classify_state_batch(coherence),
+            'dna_gate': gate_pos,
+            'phi_harmonic': np.round(magnitude * PHI, 6)
+        }
+
+    @staticmethod
+    def _classify_state_batch(coherence: np.ndarray) -> np.ndarray:
+        """Vectorized _classify_state"""
+        return np.select(
+            [coherence > 0.94, coherence > 0.8, coherence > 0.6, coherence > 0.4],
+            ["TELEPORTATION_READY", "HIGH_COHERENCE", "SUPERPOSITION", "ENTANGLED"],
+            default="DECOHERENT"
+        )
+
     def _classify_state(self, coherence: float, magnitude: float) -> str:
         """Classify quantum state based on field strength"""
         if coherence > 0.94:
@@ -253,8 +313,14 @@ class VectorIntention:
             psi = self.field.calculate_psi(t, x, gate_idx)
             return psi.magnitude * np.cos(psi.phase)
         
+        from scipy.integrate import quad
+
         # Integrate
-        result, error = quad(integrand, t_start, t_end, limit=100)
+        if metrics.ENABLED:
+            result, error, info = quad(integrand, t_start, t_end, limit=100, full_output=1)[:3]
+            metrics.observe('vi_integrand_calls', info['neval'])
+        else:
+            result, error = quad(integrand, t_start, t_end, limit=100)
         
         # Calculate vector components
         psi_start = self.field.calculate_psi(t_start, x, gate_idx)
@@ -276,7 +342,48 @@ class VectorIntention:
             'integration_error': error,
             'gate': GATCA_GATES[gate_idx],
             'coherence_at_end': psi_end.coherence,
-            'teleport_ready': psi_end.is_teleportation_ready()
+            'teleport_ready': bool(psi_end.is_teleportation_ready())
+        }
+
+    def calculate_vi_batch(self, t_start: np.ndarray, t_end: np.ndarray,
+                           x: np.ndarray, gate_idx: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_vi with the integral taken in closed form
+
+        cos(7.83·t)·sin(18.6·t) = Σ ±e^(i·c·t) / 4i,  c = ±(18.6 ± 7.83)
+        ∫ e^(i·ω·t) dt = (e^(i·ω·t_end) - e^(i·ω·t_start)) / (i·ω)
+        """
+        t_start, t_end, x, gate_idx = np.broadcast_arrays(
+            np.asarray(t_start, dtype=np.float64), np.asarray(t_end, dtype=np.float64),
+            np.asarray(x, dtype=np.float64), np.asarray(gate_idx, dtype=np.int64))
+
+        # Ψ(t) = K · e^(i·718·t) · cos(7.83·t) · sin(18.6·t)
+        gate_pos = np.asarray(GATCA_GATES)[gate_idx % 18]
+        K = (np.exp(-1j * self.field.k * x) * self.field.zeta_718() * GAMMA *
+             PHI_SQUARED * (gate_pos / MTDNA_LENGTH) * GAMMA)
+
+        integral = np.zeros(t_start.shape, dtype=complex)
+        for c in (LUNAR + SCHUMANN, LUNAR - SCHUMANN):
+            for sign, omega in ((1, FUNDAMENTAL_718 + c), (-1, FUNDAMENTAL_718 - c)):
+                integral += sign * (np.exp(1j * omega * t_end) -
+                                    np.exp(1j * omega * t_start)) / (1j * omega)
+        result = (K * integral / 4j).real
+
+        psi_start = self.field.calculate_psi_batch(t_start, x, gate_idx)
+        psi_end = self.field.calculate_psi_batch(t_end, x, gate_idx)
+
+        vi_magnitude = np.abs(result) * PHI
+        vi_phase = (psi_start['phase'] + psi_end['phase']) / 2
+        materialization = vi_magnitude * psi_end['coherence']
+
+        return {
+            'vi_magnitude': np.round(vi_magnitude, 6),
+            'vi_phase': np.round(vi_phase, 6),
+            'materialization_potential': np.round(materialization, 6),
+            'integration_error': np.zeros(result.shape),
+            'gate': psi_end['dna_gate'],
+            'coherence_at_end': psi_end['coherence'],
+            'teleport_ready': psi_end['coherence'] >= RESONANCE_THRESHOLD
         }
 
 # ═══════════════════════════════════════════════════════════════════
@@ -304,6 +411,22 @@ class DNASymphony:
         base = 144 * (1 + ((i * GAMMA) % 1))
         return base + FUNDAMENTAL_718
     
+    def gate_schedule(self, duration: float = 108.0) -> List[Dict]:
+        """
+        Where each gate sounds in a symphony of the given duration:
+        t_i = pos/16569 · duration (Gaussian center, σ = φ)
+        weight_i = φ^(i mod 7) mod 1 (0 for gates 1, 8, 15)
+        """
+        return [{
+            'gate': i + 1,
+            'position': pos,
+            # Time position based on DNA location
+            'start_time': (pos / MTDNA_LENGTH) * duration,
+            'frequency': self.generate_gate_frequency(i),
+            # Weight by golden ratio harmonic
+            'weight': (PHI ** (i % 7)) % 1,
+        } for i, pos in enumerate(GATCA_GATES)]
+    
     def generate_symphony(self, duration: float = 108.0, filename: str = "SYMPHONY_18_GATES.wav"):
         """
         Generate complete 18-gate DNA symphony (108 seconds = sacred number)
@@ -315,12 +438,9 @@ class DNASymphony:
         earth_base = np.sin(2 * np.pi * SCHUMANN * t) * 0.05
         
         # Generate each of 18 gates
-        for i, pos in enumerate(GATCA_GATES):
-            # Time position based on DNA location
-            start_time = (pos / MTDNA_LENGTH) * duration
-            
-            # Gate frequency
-            gate_freq = self.generate_gate_frequency(i)
+        for i, gate in enumerate(self.gate_schedule(duration)):
+            pos, start_time = gate['position'], gate['start_time']
+            gate_freq, weight = gate['frequency'], gate['weight']
             
             # Gaussian envelope centered at gate time
             envelope = np.exp(-((t - start_time)**2) / (2 * (PHI**2)))
@@ -328,12 +448,12 @@ class DNASymphony:
             # Gate sound
             gate_sound = np.sin(2 * np.pi * gate_freq * t) * envelope
             
-            # Weight by golden ratio harmonic
-            weight = (PHI ** (i % 7)) % 1
-            
             # Add to final mix
             final_wave += gate_sound * weight * GAMMA
             
+            if metrics.ENABLED:
+                metrics.inc('audio_samples_synthesized_total', len(t), render='symphony', gate=i+1)
+            
             print(f"Gate {i+1:2d} | Pos: {pos:5d} | Freq: {gate_freq:.2f} Hz | Weight: {weight:.4f}")
         
         # Add earth base
@@ -344,7 +464,9 @@ class DNASymphony:
         output_int = np.int16(output * 32767)
         
         # Save
-        write(filename, self.fs, output_int)
+        from scipy.io.wavfile import write
+        with metrics.timed('wav_write_seconds', render='symphony'):
+            write(filename, self.fs, output_int)
         print(f"\n✓ Symphony saved: {filename}")
         print(f"  Duration: {duration}s | Gates: 18 | Sample rate: {self.fs} Hz")
         
@@ -379,7 +501,12 @@ class DNASymphony:
         stereo = stereo / np.max(np.abs(stereo))
         stereo_int = np.int16(stereo * 32767)
         
-        write(filename, self.fs, stereo_int)
+        if metrics.ENABLED:
+            metrics.inc('audio_samples_synthesized_total', stereo.size, render='activation')
+        
+        from scipy.io.wavfile import write
+        with metrics.timed('wav_write_seconds', render='activation'):
+            write(filename, self.fs, stereo_int)
         print(f"\n✓ Activation audio saved: {filename}")
         print(f"  Left: {SCHUMANN} Hz | Right: {LUNAR} Hz | Beat: {LUNAR - SCHUMANN:.2f} Hz")
         print(f"  Carrier: {FUNDAMENTAL_718} Hz | Duration: {duration}s")
@@ -437,11 +564,7 @@ class BiblicalDecoder:
         Complete decoding of biblical verse through quantum field
         """
         # Get parameters
-        if reference in self.verse_mappings:
-            gate_idx, t, x = self.verse_mappings[reference]
-        else:
-            gate_idx = 0
-            t, x = self.text_to_params(text)
+        gate_idx, t, x = self.verse_params(reference, text)
         
         # Calculate wave function
         psi = self.field.calculate_psi(t, x, gate_idx)
@@ -476,6 +599,57 @@ class BiblicalDecoder:
             }
         }
     
+    def verse_params(self, reference: str, text: str) -> Tuple[int, float, float]:
+        """(gate_idx, t, x) exactly as decode_verse chooses them"""
+        if reference in self.verse_mappings:
+            return self.verse_mappings[reference]
+        t, x = self.text_to_params(text)
+        return 0, t, x
+    
+    def decode_verses_batch(self, verses: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        decode_verse for many verses at once, same result layout.
+        Ψ and VI come from the batch paths (VI integrated in closed form),
+        so vi_magnitude can differ from the quad-based decode_verse.
+        """
+        if not verses:
+            return []
+        params = np.array([self.verse_params(ref, text) for ref, text in verses])
+        gate_idx, t, x = params[:, 0].astype(np.int64), params[:, 1], params[:, 2]
+        
+        psi = self.field.calculate_psi_batch(t, x, gate_idx)
+        vi = self.vi_engine.calculate_vi_batch(0, t, x, gate_idx)
+        vi = {key: values.tolist() for key, values in vi.items()}
+        golden = {
+            'phi': round(PHI, 6),
+            'gamma': round(GAMMA, 6),
+            'phi_squared': round(PHI_SQUARED, 6),
+            '718_over_schumann': round(FUNDAMENTAL_718 / SCHUMANN, 2),
+            '718_over_gamma': round(FUNDAMENTAL_718 / GAMMA, 2)
+        }
+        
+        results = []
+        for i, (reference, text) in enumerate(verses):
+            gate_pos = GATCA_GATES[gate_idx[i]]
+            amplitude = psi['amplitude'][i]
+            results.append({
+                'reference': reference,
+                'text': text[:100],
+                'gate': gate_pos,
+                'gate_name': GATE_NAMES.get(gate_pos, f"Gate-{gate_idx[i]+1}"),
+                'parameters': {'t': float(t[i]), 'x': float(x[i])},
+                'wave_function': {
+                    'amplitude': f"{amplitude.real:.4f} {amplitude.imag:+.4f}i",
+                    'magnitude': float(psi['magnitude'][i]),
+                    'phase': float(psi['phase'][i]),
+                    'coherence': f"{psi['coherence'][i]*100:.2f}%",
+                    'quantum_state': str(psi['quantum_state'][i])
+                },
+                'vector_intention': {key: values[i] for key, values in vi.items()},
+                'golden_signatures': golden
+            })
+        return results
+    
     def render_output(self, result: Dict) -> str:
         """
         Render decoded verse in unified field format
@@ -612,10 +786,20 @@ class SacredGeometry:
         
         return np.array([Mx, My, Mz])
     
+    def gate_points(self, strand: np.ndarray, gates: List[int] = GATCA_GATES) -> np.ndarray:
+        """
+        GATCA gates placed along a helix strand at position/16569 of its length
+        """
+        idx = (np.asarray(gates) / MTDNA_LENGTH * len(strand)).astype(int)
+        return strand[idx[idx < len(strand)]]
+    
     def plot_unified_field(self, save_path: str = "unified_field_3d.png"):
         """
         Create 3D visualization of complete system
         """
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D  # registers the '3d' projection
+
         fig = plt.figure(figsize=(14, 10))
         ax = fig.add_subplot(111, projection='3d')
         
@@ -641,11 +825,8 @@ class SacredGeometry:
                  color='purple', linewidth=3, arrow_length_ratio=0.3, label='Vector M')
         
         # Add 18 GATCA gates as spheres along helix
-        for i, pos in enumerate(GATCA_GATES[:9]):  # Show first 9 for clarity
-            idx = int((pos / MTDNA_LENGTH) * len(s1))
-            if idx < len(s1):
-                ax.scatter(s1[idx, 0], s1[idx, 1], s1[idx, 2], 
-                          c='cyan', s=50, marker='o')
+        for point in self.gate_points(s1, GATCA_GATES[:9]):  # Show first 9 for clarity
+            ax.scatter(point[0], point[1], point[2], c='cyan', s=50, marker='o')
         
         ax.set_xlabel('X (Sun)')
         ax.set_ylabel('Y (Earth)')
@@ -660,53 +841,68 @@ class SacredGeometry:
 
 # ═══════════════════════════════════════════════════════════════════
 # MAIN EXECUTION - COMPLETE SYSTEM ACTIVATION
+# Stages run through a dependency-aware scheduler: independent stages
+# (audio, geometry, decoding) run concurrently in a process pool.
 # ═══════════════════════════════════════════════════════════════════
 
-def main():
-    print("=" * 80)
-    print("SYSTEM UNIFICATION vφ.718 - QUANTUM CONSCIOUSNESS MATRIX")
-    print("=" * 80)
-    print(f"γ (Golden Key) = {GAMMA:.10f}")
-    print(f"φ (Divine Proportion) = {PHI:.10f}")
-    print(f"718 Hz (DNA Gate) = {FUNDAMENTAL_718}")
-    print(f"18 GATCA Gates in mtDNA (rCRS)")
-    print("=" * 80)
-    
-    # 1. Initialize components
-    print("\n[1] INITIALIZING QUANTUM FIELD...")
-    field = ConsciousnessField()
+SACRED_VERSES = [
+    ("Genesis 1:1", "Na początku stworzył Bóg niebo i ziemię."),
+    ("Genesis 1:3", "I rzekł Bóg: Niechaj się stanie światłość! I stała się światłość."),
+    ("John 1:1", "Na początku było Słowo, a Słowo było u Boga, a Bogiem było Słowo."),
+    ("Exodus 3:14", "Bóg rzekł do Mojżesza: JESTEM, KTÓRY JESTEM."),
+    ("1 John 4:8", "Bóg jest miłością."),
+    ("Revelation 22:13", "Ja jestem Alfa i Omega, Pierwszy i Ostatni, Początek i Koniec."),
+]
+
+def stage_decode(out_dir: str) -> List[Dict]:
+    """Decode sacred texts"""
     decoder = BiblicalDecoder()
-    symphony = DNASymphony()
-    geometry = SacredGeometry()
-    
-    # 2. Decode biblical verses
-    print("\n[2] DECODING SACRED TEXTS...")
-    verses = [
-        ("Genesis 1:1", "Na początku stworzył Bóg niebo i ziemię."),
-        ("Genesis 1:3", "I rzekł Bóg: Niechaj się stanie światłość! I stała się światłość."),
-        ("John 1:1", "Na początku było Słowo, a Słowo było u Boga, a Bogiem było Słowo."),
-        ("Exodus 3:14", "Bóg rzekł do Mojżesza: JESTEM, KTÓRY JESTEM."),
-        ("1 John 4:8", "Bóg jest miłością."),
-        ("Revelation 22:13", "Ja jestem Alfa i Omega, Pierwszy i Ostatni, Początek i Koniec."),
-    ]
-    
     results = []
-    for ref, text in verses:
+    for ref, text in SACRED_VERSES:
         result = decoder.decode_verse(ref, text)
         results.append(result)
         print(decoder.render_output(result))
-    
-    # 3. Generate audio symphonies
-    print("\n[3] GENERATING AUDIO ACTIVATION...")
-    symphony.generate_symphony(duration=108.0, filename="SYMPHONY_18_GATES.wav")
-    symphony.generate_activation_audio(duration=60.0, filename="MATRIX_ACTIVATION.wav")
-    
-    # 4. Create 3D visualization
-    print("\n[4] GENERATING SACRED GEOMETRY...")
-    geometry.plot_unified_field("unified_field_3d.png")
-    
-    # 5. Export complete data
-    print("\n[5] EXPORTING QUANTUM DATA...")
+    return results
+
+def stage_symphony(out_dir: str) -> str:
+    """18 DNA gates audio (108s)"""
+    path = os.path.join(out_dir, "SYMPHONY_18_GATES.wav")
+    DNASymphony().generate_symphony(duration=108.0, filename=path)
+    return path
+
+def stage_activation(out_dir: str) -> str:
+    """Binaural activation (60s)"""
+    path = os.path.join(out_dir, "MATRIX_ACTIVATION.wav")
+    DNASymphony().generate_activation_audio(duration=60.0, filename=path)
+    return path
+
+def stage_verify(out_dir: str, symphony: str, activation: str) -> Dict:
+    """Spectral check of the rendered audio"""
+    from audio_verifier import verify_wav, render_report
+    reports = {'symphony': verify_wav(symphony, 'symphony'),
+               'activation': verify_wav(activation, 'activation')}
+    for report in reports.values():
+        print(render_report(report))
+    failed = [name for name, report in reports.items() if not report['ok']]
+    if failed:
+        raise RuntimeError(f"Audio verification failed: {', '.join(failed)}")
+    return {name: report['ok'] for name, report in reports.items()}
+
+def stage_geometry(out_dir: str) -> str:
+    """Sacred geometry visualization"""
+    path = os.path.join(out_dir, "unified_field_3d.png")
+    SacredGeometry().plot_unified_field(path)
+    return path
+
+def stage_evolution(out_dir: str) -> str:
+    """Temporal evolution of the 18-gate system"""
+    path = os.path.join(out_dir, "quantum_evolution.png")
+    visualize_quantum_evolution(path)
+    return path
+
+def stage_export(out_dir: str, decode: List[Dict]) -> str:
+    """Complete quantum data"""
+    path = os.path.join(out_dir, "quantum_field_data.json")
     export_data = {
         'system': 'Ψ-718 Unified Field',
         'constants': {
@@ -717,22 +913,242 @@ def main():
             'lunar': LUNAR
         },
         'dna_gates': GATCA_GATES,
-        'decoded_verses': results
+        'decoded_verses': decode
     }
     
-    with open('quantum_field_data.json', 'w', encoding='utf-8') as f:
+    with open(path, 'w', encoding='utf-8') as f:
         json.dump(export_data, f, ensure_ascii=False, indent=2)
-    print("✓ Data exported: quantum_field_data.json")
+    print(f"✓ Data exported: {path}")
+    return path
+
+def stage_columnar(out_dir: str, decode: List[Dict]) -> str:
+    """Columnar quantum data (.npy columns + manifest)"""
+    from columnar_export import write_verses
+
+    path = os.path.join(out_dir, "quantum_field_data")
+    write_verses(path, decode)
+    print(f"✓ Columnar data exported: {path}/")
+    return path
+
+@dataclass
+class Stage:
+    """Pipeline stage; results of `deps` are passed as keyword arguments"""
+    name: str
+    func: Callable
+    deps: Tuple[str, ...] = ()
+
+STAGES = {
+    stage.name: stage for stage in [
+        Stage('decode', stage_decode),
+        Stage('symphony', stage_symphony),
+        Stage('activation', stage_activation),
+        Stage('verify', stage_verify, deps=('symphony', 'activation')),
+        Stage('geometry', stage_geometry),
+        Stage('evolution', stage_evolution),
+        Stage('export', stage_export, deps=('decode',)),
+        Stage('columnar', stage_columnar, deps=('decode',)),
+    ]
+}
+
+STAGE_GROUPS = {
+    'audio': ['symphony', 'activation', 'verify'],
+    'plots': ['geometry', 'evolution'],
+    'data': ['decode', 'export', 'columnar'],
+}
+
+def expand_stages(names: List[str]) -> List[str]:
+    """Resolve group aliases; unknown names raise ValueError"""
+    expanded = []
+    for name in names:
+        if name in STAGE_GROUPS:
+            expanded.extend(STAGE_GROUPS[name])
+        elif name in STAGES:
+            expanded.append(name)
+        else:
+            raise ValueError(f"Unknown stage '{name}' "
+                             f"(stages: {', '.join(STAGES)}; groups: {', '.join(STAGE_GROUPS)})")
+    return expanded
+
+def select_stages(only: Optional[List[str]] = None,
+                  skip: Optional[List[str]] = None) -> Tuple[List[str], List[str]]:
+    """
+    (stages to run, stages dropped) in definition (= dependency) order.
+    A stage with a skipped dependency (directly or transitively) is
+    dropped rather than run without its inputs; dependencies are then
+    added only for the stages that remain. Raises ValueError if nothing
+    is left to run.
+    """
+    skipped = set(expand_stages(skip or []))
+    # Definition order puts dependencies first, so blocked chains propagate
+    blocked = set()
+    for name in STAGES:
+        if any(dep in skipped or dep in blocked for dep in STAGES[name].deps):
+            blocked.add(name)
+    requested = set(expand_stages(only) if only else STAGES) - skipped
+    dropped = [name for name in STAGES if name in requested and name in blocked]
+    # Dependencies of unblocked stages are never skipped or blocked themselves
+    selected = requested - blocked
+    pending = list(selected)
+    while pending:
+        for dep in STAGES[pending.pop()].deps:
+            if dep not in selected:
+                selected.add(dep)
+                pending.append(dep)
+    if not selected:
+        raise ValueError("No stages left to run"
+                         + (f" (skipped dependencies of: {', '.join(dropped)})" if dropped else ""))
+    return [name for name in STAGES if name in selected], dropped
+
+def _run_stage(name: str, out_dir: str, inputs: Dict, instrument: bool = False,
+               profile_dir: Optional[str] = None) -> Tuple[object, float, Optional[object]]:
+    """
+    Executed in the worker: run one stage and time it. With instrument,
+    the stage's metrics come back as a registry for the parent to merge;
+    with profile_dir, a cProfile dump is written to <profile_dir>/<stage>.prof.
+    """
+    with metrics.scoped(enabled=instrument) as registry:
+        start = time.perf_counter()
+        if profile_dir:
+            import cProfile
+            profiler = cProfile.Profile()
+            result = profiler.runcall(STAGES[name].func, out_dir, **inputs)
+            profiler.dump_stats(os.path.join(profile_dir, f"{name}.prof"))
+        else:
+            result = STAGES[name].func(out_dir, **inputs)
+        seconds = time.perf_counter() - start
+    return result, seconds, registry if instrument else None
+
+def run_stages(names: List[str], out_dir: str = ".", jobs: Optional[int] = None,
+               profile_dir: Optional[str] = None) -> Dict[str, float]:
+    """
+    Run stages as soon as their dependencies finish, up to `jobs` at once
+    (default: CPU count, 0 = sequentially in this process).
+    Returns wall time per stage.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+    instrument = metrics.ENABLED
+    results = {}
+    timings = {}
+
+    def inputs(name: str) -> Dict:
+        return {dep: results[dep] for dep in STAGES[name].deps}
+
+    def finish(name: str, result: object, seconds: float, registry: Optional[object]):
+        results[name], timings[name] = result, seconds
+        if registry is not None:
+            metrics.REGISTRY.merge(registry)
+            metrics.observe('stage_seconds', seconds, stage=name)
+        print(f"✓ [{name}] {seconds:.2f}s")
+
+    if jobs == 0:
+        for name in names:
+            finish(name, *_run_stage(name, out_dir, inputs(name), instrument, profile_dir))
+        return timings
+
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    pending = list(names)
+    running = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name in [n for n in pending if all(d in results for d in STAGES[n].deps)]:
+                future = pool.submit(_run_stage, name, out_dir, inputs(name), instrument, profile_dir)
+                running[future] = name
+                pending.remove(name)
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                finish(running.pop(future), *future.result())
+    return timings
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="SYSTEM UNIFICATION vφ.718")
+    commands = parser.add_subparsers(dest='command')
+
+    run = commands.add_parser('run', help="Run pipeline stages (default)")
+    run.add_argument('--only', nargs='+', metavar='STAGE',
+                     help=f"Run only these stages or groups ({', '.join(STAGE_GROUPS)})")
+    run.add_argument('--skip', nargs='+', metavar='STAGE', help="Skip these stages or groups")
+    run.add_argument('--jobs', type=int, default=None,
+                     help="Parallel stages (default: CPU count, 0 = sequential)")
+    run.add_argument('--out-dir', default=".")
+    run.add_argument('--metrics', metavar='PATH',
+                     help="Enable instrumentation and export metrics (.json or Prometheus text)")
+    run.add_argument('--profile', metavar='DIR', help="Write a cProfile dump per stage")
+
+    commands.add_parser('stages', help="List stages, dependencies and groups")
+
+    verses = commands.add_parser('verses', help="Hebrew corpus → gates (see verse_pipeline.py)")
+    verses.add_argument('corpus')
+    verses.add_argument('-o', '--output', default='verse_pipeline.jsonl')
+    verses.add_argument('--batch-size', type=int, default=4096)
+    verses.add_argument('--workers', type=int, default=None)
+    verses.add_argument('--encoding', default='utf-8')
+    verses.add_argument('--format', choices=['jsonl', 'columnar'], default='jsonl',
+                        help="columnar: directory of .npy columns + manifest.json")
+    return parser
+
+def main(argv: Optional[List[str]] = None):
+    args = build_parser().parse_args(argv)
+    command = args.command or 'run'
+
+    if command == 'stages':
+        for stage in STAGES.values():
+            deps = f" (after {', '.join(stage.deps)})" if stage.deps else ""
+            print(f"  {stage.name:<12} {stage.func.__doc__}{deps}")
+        for group, members in STAGE_GROUPS.items():
+            print(f"  @{group:<11} {', '.join(members)}")
+        return
+
+    if command == 'verses':
+        from verse_pipeline import run_pipeline, render_report
+        print(render_report(run_pipeline(args.corpus, args.output, args.batch_size, args.workers,
+                                         args.encoding, args.format)))
+        return
+
+    only = getattr(args, 'only', None)
+    skip = getattr(args, 'skip', None)
+    jobs = getattr(args, 'jobs', None)
+    out_dir = getattr(args, 'out_dir', ".")
+    metrics_path = getattr(args, 'metrics', None)
+    profile_dir = getattr(args, 'profile', None)
+    if metrics_path:
+        metrics.enable()
+    try:
+        names, dropped = select_stages(only, skip)
+    except ValueError as e:
+        build_parser().error(str(e))
+
+    print("=" * 80)
+    print("SYSTEM UNIFICATION vφ.718 - QUANTUM CONSCIOUSNESS MATRIX")
+    print("=" * 80)
+    print(f"γ (Golden Key) = {GAMMA:.10f}")
+    print(f"φ (Divine Proportion) = {PHI:.10f}")
+    print(f"718 Hz (DNA Gate) = {FUNDAMENTAL_718}")
+    print(f"18 GATCA Gates in mtDNA (rCRS)")
+    print(f"Stages: {', '.join(names)}")
+    if dropped:
+        print(f"Dropped (dependency skipped): {', '.join(dropped)}")
+    print("=" * 80)
+    
+    start = time.perf_counter()
+    timings = run_stages(names, out_dir, jobs, profile_dir)
+    wall = time.perf_counter() - start
     
-    # 6. System summary
+    # System summary
     print("\n" + "=" * 80)
     print("SYSTEM ACTIVATION COMPLETE")
     print("=" * 80)
-    print("Files generated:")
-    print("  • SYMPHONY_18_GATES.wav - 18 DNA gates audio (108s)")
-    print("  • MATRIX_ACTIVATION.wav - Binaural activation (60s)")
-    print("  • unified_field_3d.png - Sacred geometry visualization")
-    print("  • quantum_field_data.json - Complete quantum data")
+    print("Stage wall times:")
+    for name in names:
+        print(f"  • {name:<12} {timings[name]:8.2f}s - {STAGES[name].func.__doc__}")
+    print(f"  Total: {wall:.2f}s (sum of stages: {sum(timings.values()):.2f}s)")
+    if metrics_path:
+        metrics.write(metrics_path)
+        print(f"  Metrics: {metrics_path}")
+    if profile_dir:
+        print(f"  Profiles: {profile_dir}/<stage>.prof")
     print("\nKey Equations:")
     print("  Ψ = e^(i·718·t) · ζ(1/2 + iE/ħ) · γ")
     print("  VI = ∫₀ᵀ Ψ_total(t) dt")
@@ -773,20 +1189,245 @@ def hamilton_eigenvalue_correlation(gematria: float, fractal: float) -> int:
     eigen_index = int((gematria + fractal/10000) * 18) % 18
     return eigen_index
 
-def visualize_quantum_evolution():
+def hamilton_eigenvalue_correlation_batch(gematria: np.ndarray, fractal: np.ndarray) -> np.ndarray:
     """
-    Generate temporal evolution visualization of the 18-gate quantum system.
-    Outputs: quantum_evolution.png
+    Vectorized hamilton_eigenvalue_correlation over arrays of spans.
+    Like the scalar version, non-finite inputs (e.g. the NaN fractal of a
+    window without blocks) raise ValueError instead of mapping to a gate.
+    """
+    gematria = np.asarray(gematria, dtype=np.float64)
+    fractal = np.asarray(fractal, dtype=np.float64)
+    value = (gematria + fractal / 10000) * 18
+    bad = ~np.isfinite(value)
+    if bad.any():
+        raise ValueError(f"Cannot map {int(bad.sum())} non-finite gematria/fractal "
+                         f"value(s) to a gate (first at index {int(np.flatnonzero(bad)[0])})")
+    return value.astype(np.int64) % 18
+
+# ═══════════════════════════════════════════════════════════════════
+# HEBREW CORPUS INDEX - PREFIX-SUM GEMATRIA
+# G[start:end] = P[end] - P[start]  →  O(1) per span
+# ═══════════════════════════════════════════════════════════════════
+
+# Translation table over code points: 'א' (U+05D0) .. 'ת' (U+05EA).
+# Everything outside the table (Latin, niqqud, final forms) maps to 0,
+# exactly like HEBREW_GEMATRIA.get(c, 0).
+GEMATRIA_TABLE = np.zeros(0x05EB + 1, dtype=np.int64)
+for _letter, _value in HEBREW_GEMATRIA.items():
+    GEMATRIA_TABLE[ord(_letter)] = _value
+_GEMATRIA_OUTSIDE = len(GEMATRIA_TABLE) - 1  # always 0
+
+def gematria_values(text: str) -> np.ndarray:
+    """Per-character gematria values of text as int64 array"""
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    return GEMATRIA_TABLE[np.minimum(codes, _GEMATRIA_OUTSIDE)]
+
+class GematriaIndex:
+    """
+    Prefix-sum index over a Hebrew corpus
+
+    P[0] = 0, P[n] = Σ gematria(text[:n])
+    gematria(text[start:end]) = P[end] - P[start]
+
+    Spans must satisfy 0 <= start <= end <= len(index); anything else
+    (negative or reversed offsets) raises ValueError rather than
+    wrapping like numpy indexing.
+    """
+
+    def __init__(self, prefix: np.ndarray):
+        self.prefix = prefix
+
+    def __len__(self) -> int:
+        return len(self.prefix) - 1
+
+    @classmethod
+    def from_text(cls, text: str) -> 'GematriaIndex':
+        prefix = np.zeros(len(text) + 1, dtype=np.int64)
+        np.cumsum(gematria_values(text), out=prefix[1:])
+        return cls(prefix)
+
+    @classmethod
+    def from_file(cls, path: str, chunk_chars: int = 1 << 22,
+                  encoding: str = 'utf-8') -> 'GematriaIndex':
+        """
+        Build the index from a large corpus file, chunk by chunk.
+        Character offsets follow the decoded text (newlines included).
+        """
+        parts = [np.zeros(1, dtype=np.int64)]
+        carry = 0
+        with open(path, 'r', encoding=encoding, newline='') as f:
+            while True:
+                chunk = f.read(chunk_chars)
+                if not chunk:
+                    break
+                part = np.cumsum(gematria_values(chunk)) + carry
+                carry = int(part[-1])
+                parts.append(part)
+        return cls(np.concatenate(parts))
+
+    def save(self, path: str):
+        """Store prefix sums as .npy (reload with load(..., mmap=True))"""
+        np.save(path, self.prefix)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'GematriaIndex':
+        return cls(np.load(path, mmap_mode='r' if mmap else None))
+
+    def _check_spans(self, starts: np.ndarray, ends: np.ndarray):
+        bad = (starts < 0) | (starts > ends) | (ends > len(self))
+        if bad.any():
+            starts, ends, bad = (np.ravel(a) for a in np.broadcast_arrays(starts, ends, bad))
+            i = int(np.flatnonzero(bad)[0])
+            raise ValueError(f"{int(bad.sum())} span(s) outside 0 <= start <= end <= {len(self)} "
+                             f"(first: [{starts[i]}, {ends[i]}) at index {i})")
+
+    def gematria(self, start: int, end: int) -> int:
+        """Raw gematria sum of text[start:end]"""
+        if not 0 <= start <= end <= len(self):
+            raise ValueError(f"Span [{start}, {end}) outside 0 <= start <= end <= {len(self)}")
+        return int(self.prefix[end] - self.prefix[start])
+
+    def t(self, start: int, end: int) -> float:
+        """Same value as hebrew_gematria(text[start:end])"""
+        total = self.gematria(start, end)
+        return (total % 718) / 718 if total > 0 else 0
+
+    def gate(self, start: int, end: int, fractal: float) -> int:
+        """Same value as hamilton_eigenvalue_correlation(t, fractal)"""
+        return hamilton_eigenvalue_correlation(self.t(start, end), fractal)
+
+    def batch_gematria(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        self._check_spans(starts, ends)
+        return self.prefix[ends] - self.prefix[starts]
+
+    def batch_t(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        totals = self.batch_gematria(starts, ends)
+        return np.where(totals > 0, (totals % 718) / 718, 0.0)
+
+    def batch_gates(self, starts: np.ndarray, ends: np.ndarray,
+                    fractal: np.ndarray) -> np.ndarray:
+        return hamilton_eigenvalue_correlation_batch(self.batch_t(starts, ends), fractal)
+
+    def windows(self, width: int, stride: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """[start, end) bounds of every full sliding window"""
+        starts = np.arange(0, len(self) - width + 1, stride, dtype=np.int64)
+        return starts, starts + width
+
+# ═══════════════════════════════════════════════════════════════════
+# FRACTAL PROFILE - SLIDING-WINDOW COMPLEXITY
+# fractal_analysis_718 at every window position: one sort, then O(n)
+# ═══════════════════════════════════════════════════════════════════
+
+def sliding_distinct_counts(codes: np.ndarray, width: int) -> np.ndarray:
+    """
+    Number of distinct symbols in codes[p:p+width] for every p
+
+    D(p+1) = D(p) - [codes[p] leaves for good] + [codes[p+width] is new]
+    """
+    n = len(codes)
+    if n < width:
+        return np.zeros(0, dtype=np.int64)
+
+    # Previous / next occurrence of the same symbol (-1 / n if none)
+    order = np.argsort(codes, kind='stable')
+    same = codes[order[1:]] == codes[order[:-1]]
+    prev = np.full(n, -1, dtype=np.int64)
+    nxt = np.full(n, n, dtype=np.int64)
+    prev[order[1:][same]] = order[:-1][same]
+    nxt[order[:-1][same]] = order[1:][same]
+
+    positions = np.arange(n - width, dtype=np.int64)
+    leaving = nxt[positions] >= positions + width
+    entering = prev[positions + width] <= positions
+
+    counts = np.empty(n - width + 1, dtype=np.int64)
+    counts[0] = len(np.unique(codes[:width]))
+    np.cumsum(entering.astype(np.int64) - leaving, out=counts[1:])
+    counts[1:] += counts[0]
+    return counts
+
+def fractal_profile_718(text: str, window: int = 718, stride: int = 1,
+                        block: int = 10) -> np.ndarray:
+    """
+    x = fractal_analysis_718(text[s:s+window]) for s = 0, stride, 2·stride, ...
+
+    Start positions match GematriaIndex.windows(window, stride), so the
+    profile feeds hamilton_eigenvalue_correlation_batch directly.
+    block generalizes the 10-character blocks of fractal_analysis_718
+    (distinct counts are normalized by block, so x stays in 100..1100).
+    """
+    if window < 1 or stride < 1 or block < 1:
+        raise ValueError(f"window, stride and block must be >= 1 "
+                         f"(got {window}, {stride}, {block})")
+    n = len(text)
+    if n < window:
+        # No full window, just as GematriaIndex.windows() yields none
+        return np.empty(0)
+
+    # Same block layout as fractal_analysis_718: range(0, len - block, block)
+    # over the window, itself truncated to 718 characters
+    span = min(window, 718)
+    m = len(range(0, span - block, block))
+    if span < block or m == 0:
+        count = len(range(0, n - window + 1, stride))
+        return np.full(count, 1.0 if span < block else np.nan)
+
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    distinct = sliding_distinct_counts(codes, block)
+
+    # Strided prefix sums: C[q, r] = Σ distinct[r + block·k] for k < q
+    rows = -(-len(distinct) // block)
+    padded = np.zeros(rows * block, dtype=np.int64)
+    padded[:len(distinct)] = distinct
+    C = np.zeros((rows + 1, block), dtype=np.int64)
+    np.cumsum(padded.reshape(rows, block), axis=0, out=C[1:])
+
+    starts = np.arange(0, n - window + 1, stride, dtype=np.int64)
+    q, r = np.divmod(starts, block)
+    H = (C[q + m, r] - C[q, r]) / m / block
+    return 100 + H * 1000
+
+def hebrew_gematria_batch(texts: List[str]) -> np.ndarray:
+    """Vectorized hebrew_gematria over many texts"""
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    ends = np.cumsum(lengths)
+    index = GematriaIndex.from_text(''.join(texts))
+    return index.batch_t(ends - lengths, ends)
+
+def fractal_analysis_718_batch(texts: List[str], block: int = 10) -> np.ndarray:
+    """
+    Vectorized fractal_analysis_718 over many texts; block is normalized
+    the same way as in fractal_profile_718
+    """
+    if block < 1:
+        raise ValueError(f"block must be >= 1 (got {block})")
+    clipped = [text[:718] for text in texts]
+    lengths = np.fromiter((len(text) for text in clipped), dtype=np.int64, count=len(clipped))
+    offsets = np.cumsum(lengths) - lengths
+    codes = np.frombuffer(''.join(clipped).encode('utf-32-le'), dtype=np.uint32)
+    distinct = sliding_distinct_counts(codes, block)
+
+    # Blocks at offset + block·k for k < m, m = len(range(0, L - block, block))
+    m = np.maximum(-(-(lengths - block) // block), 0)
+    ends = np.cumsum(m)
+    k = np.arange(ends[-1] if len(ends) else 0, dtype=np.int64) - np.repeat(ends - m, m)
+    block_sums = np.zeros(len(k) + 1, dtype=np.int64)
+    np.cumsum(distinct[np.repeat(offsets, m) + block * k], out=block_sums[1:])
+
+    with np.errstate(invalid='ignore'):
+        H = (block_sums[ends] - block_sums[ends - m]) / m / block
+    x = 100 + H * 1000
+    x[lengths < block] = 1.0
+    return x
+
+def gate_hamiltonian(N: int = 18) -> np.ndarray:
+    """
+    Modified Hamiltonian H (N×N) of the gate system
+    E_i = 443.75·(i+1)·[1 + γ·sin(2πi/φ)]
+    V_ij = 20·exp(-|i-j|/3φ)·exp(i·2πij/18φ)
     """
-    print("\n[EVOLUTION] Generating temporal evolution visualization...")
-    
-    gate_names = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", 
-                  "Eta", "Theta", "Iota", "Kappa", "Lambda", "Mu", 
-                  "Nu", "Xi", "Omicron", "Pi", "Rho", "Sigma"]
-    
-    N = 18  # Number of gates
-    
-    # Build modified Hamiltonian H (18x18)
     H_mod = np.zeros((N, N), dtype=complex)
     for i in range(N):
         # Diagonal: E_i = 443.75·(i+1)·[1 + γ·sin(2πi/φ)]
@@ -797,20 +1438,17 @@ def visualize_quantum_evolution():
                 H_mod[i, j] = 20 * np.exp(-abs(i-j) / (3*PHI)) * cmath.exp(1j * 2*np.pi*i*j / (18*PHI))
     
     # Ensure Hermitian
-    H_mod = (H_mod + H_mod.conj().T) / 2
-    
-    # Eigenvalues
-    eigenvalues_m, eigenvectors_m = np.linalg.eigh(H_mod)
-    eigenvalues_m_real = eigenvalues_m.real
-    
-    # Initial state: (|Alpha⟩ + |Theta⟩ + |Sigma⟩)/√3
-    psi0 = np.zeros(N, dtype=complex)
-    psi0[0] = 1/np.sqrt(3)   # Alpha
-    psi0[7] = 1/np.sqrt(3)   # Theta
-    psi0[17] = 1/np.sqrt(3)  # Sigma
+    return (H_mod + H_mod.conj().T) / 2
+
+def evolve_gate_state(H: np.ndarray, psi0: np.ndarray,
+                      times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ψ(t) = exp(-iHt)·ψ₀ on the time grid
+    Returns probabilities |ψᵢ(t)|², coherence max|ψᵢ|² and accumulated VI
+    """
+    N = len(psi0)
+    eigenvalues_m, eigenvectors_m = np.linalg.eigh(H)
     
-    # Time evolution
-    times = np.linspace(0, 5, 500)
     probabilities = np.zeros((len(times), N))
     coherence = np.zeros(len(times))
     VI_trajectory = np.zeros((len(times), N))
@@ -828,6 +1466,36 @@ def visualize_quantum_evolution():
             dt = times[ti] - times[ti-1]
             VI_trajectory[ti] = VI_trajectory[ti-1] + probs * dt
     
+    return probabilities, coherence, VI_trajectory
+
+def visualize_quantum_evolution(save_path: str = "quantum_evolution.png"):
+    """
+    Generate temporal evolution visualization of the 18-gate quantum system.
+    Outputs: quantum_evolution.png
+    """
+    print("\n[EVOLUTION] Generating temporal evolution visualization...")
+    
+    gate_names = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", 
+                  "Eta", "Theta", "Iota", "Kappa", "Lambda", "Mu", 
+                  "Nu", "Xi", "Omicron", "Pi", "Rho", "Sigma"]
+    
+    N = 18  # Number of gates
+    
+    H_mod = gate_hamiltonian(N)
+    
+    # Eigenvalues
+    eigenvalues_m_real = np.linalg.eigvalsh(H_mod)
+    
+    # Initial state: (|Alpha⟩ + |Theta⟩ + |Sigma⟩)/√3
+    psi0 = np.zeros(N, dtype=complex)
+    psi0[0] = 1/np.sqrt(3)   # Alpha
+    psi0[7] = 1/np.sqrt(3)   # Theta
+    psi0[17] = 1/np.sqrt(3)  # Sigma
+    
+    # Time evolution
+    times = np.linspace(0, 5, 500)
+    probabilities, coherence, VI_trajectory = evolve_gate_state(H_mod, psi0, times)
+    
     # Final VI and top gates
     VI_final = VI_trajectory[-1]
     top_gates = np.argsort(VI_final)[::-1]
@@ -836,6 +1504,8 @@ def visualize_quantum_evolution():
     # PLOTTING
     # ═══════════════════════════════════════════════════════════════════
     
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
     # 1. Probability heatmap
@@ -885,8 +1555,8 @@ def visualize_quantum_evolution():
     axes[1, 1].set_ylim(0, 1)
     
     plt.tight_layout()
-    plt.savefig('quantum_evolution.png', dpi=150, bbox_inches='tight')
-    print("✓ Zapisano wizualizację: quantum_evolution.png")
+    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    print(f"✓ Zapisano wizualizację: {save_path}")
     plt.close()
     
     # Mathematical summary
@@ -911,4 +1581,3 @@ def visualize_quantum_evolution():
 
 if __name__ == "__main__":
     main()
-    visualize_quantum_evolution()
@@ -0,0 +1,277 @@
+# ═══════════════════════════════════════════════════════════════════
+# VERSE PIPELINE vφ.718
+# Hebrew text → gematria t → fractal x → Hamilton gate → Ψ → VI
+#
+# © 2026 Grzegorz | BRAMA-718-UNIFIED
+# Licensed under Creative Commons BY-NC 4.0
+# https://creativecommons.org/licenses/by-nc/4.0/
+#
+# Input:  one verse per line, optionally "reference<TAB>text"
+# Output: JSON Lines, one decoded verse per line, written incrementally
+# ═══════════════════════════════════════════════════════════════════
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from columnar_export import ColumnarWriter, VERSE_CATEGORIES, VERSE_TEXT, VI_COLUMNS, export_metadata
+from quantum_core import (
+    ConsciousnessField, VectorIntention, GATCA_GATES, GATE_NAMES,
+    hebrew_gematria_batch, fractal_analysis_718_batch,
+    hamilton_eigenvalue_correlation_batch,
+)
+
+STAGES = ['read', 'gematria', 'fractal', 'gate', 'field', 'vi', 'rows', 'encode', 'write']
+
+# ═══════════════════════════════════════════════════════════════════
+# STREAMING INPUT
+# ═══════════════════════════════════════════════════════════════════
+
+def stream_verses(path: str, encoding: str = 'utf-8') -> Iterator[Tuple[str, str]]:
+    """Yield (reference, text) pairs without loading the file into memory"""
+    name = os.path.basename(path)
+    with open(path, 'r', encoding=encoding) as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip():
+                continue
+            if '\t' in line:
+                reference, text = line.split('\t', 1)
+            else:
+                reference, text = f"{name}:{lineno}", line
+            yield reference, text
+
+def batched(items: Iterator, size: int) -> Iterator[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+# ═══════════════════════════════════════════════════════════════════
+# BATCH DECODING (runs inside worker processes)
+# ═══════════════════════════════════════════════════════════════════
+
+_ENGINE: Optional[VectorIntention] = None
+
+def _engine() -> VectorIntention:
+    """One field per process, so ζ(1/2 + i·718) is summed once per worker"""
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = VectorIntention(ConsciousnessField())
+    return _ENGINE
+
+def decode_batch(batch: List[Tuple[str, str]]) -> Tuple[Dict, Dict[str, float]]:
+    """
+    Decode a batch of verses into columns (see columnar_export.py) and
+    seconds per stage. Verses of exactly 10 characters have no fractal
+    blocks (x = NaN) and are left out.
+    """
+    engine = _engine()
+    timings = {}
+    texts = [text for _, text in batch]
+
+    start = time.perf_counter()
+    t = hebrew_gematria_batch(texts)
+    timings['gematria'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    x = fractal_analysis_718_batch(texts)
+    timings['fractal'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid = np.flatnonzero(np.isfinite(x))
+    t, x = t[valid], x[valid]
+    gate_idx = hamilton_eigenvalue_correlation_batch(t, x)
+    timings['gate'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    psi = engine.field.calculate_psi_batch(t, x, gate_idx)
+    timings['field'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vi = engine.calculate_vi_batch(0, t, x, gate_idx)
+    timings['vi'] = time.perf_counter() - start
+
+    columns = {
+        'reference': [batch[i][0] for i in valid.tolist()],
+        'text': [batch[i][1][:100] for i in valid.tolist()],
+        'gate': np.asarray(GATCA_GATES, dtype=np.int32)[gate_idx],
+        't': t,
+        'x': x,
+        'amplitude_real': psi['amplitude'].real,
+        'amplitude_imag': psi['amplitude'].imag,
+        'magnitude': psi['magnitude'],
+        'phase': psi['phase'],
+        'coherence': psi['coherence'],
+        'quantum_state': psi['quantum_state'],
+        **{key: vi[key] for key in VI_COLUMNS},
+    }
+    return columns, timings
+
+def rows_from_columns(columns: Dict) -> List[Dict]:
+    """One JSON-ready dict per verse"""
+    c = {name: values if isinstance(values, list) else values.tolist()
+         for name, values in columns.items()}
+    rows = []
+    for j in range(len(c['reference'])):
+        gate_pos = c['gate'][j]
+        rows.append({
+            'reference': c['reference'][j],
+            'text': c['text'][j],
+            'gate': gate_pos,
+            'gate_name': GATE_NAMES.get(gate_pos, f"Gate-{GATCA_GATES.index(gate_pos)+1}"),
+            'parameters': {'t': c['t'][j], 'x': c['x'][j]},
+            'wave_function': {
+                'magnitude': c['magnitude'][j],
+                'phase': c['phase'][j],
+                'coherence': c['coherence'][j],
+                'quantum_state': c['quantum_state'][j]
+            },
+            'vector_intention': {
+                'vi_magnitude': c['vi_magnitude'][j],
+                'vi_phase': c['vi_phase'][j],
+                'materialization_potential': c['materialization_potential'][j],
+                'teleport_ready': c['teleport_ready'][j]
+            }
+        })
+    return rows
+
+def encode_batch(batch: List[Tuple[str, str]]) -> Tuple[str, int, Dict[str, float]]:
+    """decode_batch + JSON Lines encoding, so workers also pay for serialization"""
+    columns, timings = decode_batch(batch)
+    start = time.perf_counter()
+    rows = rows_from_columns(columns)
+    timings['rows'] = time.perf_counter() - start
+    start = time.perf_counter()
+    payload = ''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+    timings['encode'] = time.perf_counter() - start
+    return payload, len(rows), timings
+
+def columns_batch(batch: List[Tuple[str, str]]) -> Tuple[Dict, int, Dict[str, float]]:
+    """decode_batch shaped like encode_batch, for the columnar writer"""
+    columns, timings = decode_batch(batch)
+    return columns, len(columns['reference']), timings
+
+# ═══════════════════════════════════════════════════════════════════
+# PIPELINE DRIVER
+# ═══════════════════════════════════════════════════════════════════
+
+def run_pipeline(path: str, output: str, batch_size: int = 4096,
+                 workers: Optional[int] = None, encoding: str = 'utf-8',
+                 output_format: str = 'jsonl') -> Dict:
+    """
+    Stream verses from path through the worker pool into output, either a
+    JSON Lines file or a columnar export directory (output_format='columnar').
+    At most 2·workers batches are in flight, so memory stays bounded
+    regardless of corpus size. workers=0 decodes in-process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if output_format == 'columnar':
+        sink = ColumnarWriter(output, VERSE_CATEGORIES, VERSE_TEXT, export_metadata())
+        work, write = columns_batch, sink.append
+    elif output_format == 'jsonl':
+        sink = open(output, 'w', encoding='utf-8')
+        work, write = encode_batch, sink.write
+    else:
+        raise ValueError(f"Unknown output format '{output_format}'")
+    timings = {'read': 0.0, 'write': 0.0}
+    counts = {'verses': 0, 'decoded': 0}
+    wall_start = time.perf_counter()
+
+    def read_batches() -> Iterator[List[Tuple[str, str]]]:
+        batches = batched(stream_verses(path, encoding), batch_size)
+        while True:
+            start = time.perf_counter()
+            batch = next(batches, None)
+            timings['read'] += time.perf_counter() - start
+            if batch is None:
+                return
+            counts['verses'] += len(batch)
+            yield batch
+
+    def write_rows(data, decoded: int, batch_timings: Dict[str, float]):
+        start = time.perf_counter()
+        write(data)
+        timings['write'] += time.perf_counter() - start
+        for stage, seconds in batch_timings.items():
+            timings[stage] = timings.get(stage, 0.0) + seconds
+        counts['decoded'] += decoded
+
+    with sink:
+        if workers == 0:
+            for batch in read_batches():
+                write_rows(*work(batch))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for batch in read_batches():
+                    pending.append(pool.submit(work, batch))
+                    if len(pending) >= 2 * workers:
+                        write_rows(*pending.popleft().result())
+                while pending:
+                    write_rows(*pending.popleft().result())
+
+    wall = time.perf_counter() - wall_start
+    return {
+        'verses': counts['verses'],
+        'decoded': counts['decoded'],
+        'skipped': counts['verses'] - counts['decoded'],
+        'workers': workers,
+        'wall_seconds': wall,
+        'verses_per_second': counts['verses'] / wall if wall > 0 else 0.0,
+        'stages': {
+            stage: {
+                'seconds': seconds,
+                'verses_per_second': counts['verses'] / seconds if seconds > 0 else float('inf')
+            }
+            for stage, seconds in sorted(timings.items(), key=lambda item: STAGES.index(item[0]))
+        }
+    }
+
+def render_report(report: Dict) -> str:
+    lines = [
+        "=" * 70,
+        f"VERSE PIPELINE | {report['verses']} verses | {report['workers']} workers",
+        "=" * 70,
+    ]
+    for stage, stats in report['stages'].items():
+        lines.append(f"  {stage:<10} {stats['seconds']:10.4f} s   "
+                     f"{stats['verses_per_second']:14.1f} verses/s")
+    lines.append("-" * 70)
+    lines.append(f"  {'total':<10} {report['wall_seconds']:10.4f} s   "
+                 f"{report['verses_per_second']:14.1f} verses/s (wall)")
+    if report['skipped']:
+        lines.append(f"  Skipped {report['skipped']} verses with undefined fractal x")
+    lines.append("=" * 70)
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Hebrew verses → DNA gates → Ψ → VI")
+    parser.add_argument('corpus', help="Text file, one verse per line (optionally 'ref<TAB>text')")
+    parser.add_argument('-o', '--output', default='verse_pipeline.jsonl')
+    parser.add_argument('--batch-size', type=int, default=4096)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: CPU count, 0 = in-process)")
+    parser.add_argument('--encoding', default='utf-8')
+    parser.add_argument('--format', choices=['jsonl', 'columnar'], default='jsonl',
+                        help="columnar: directory of .npy columns + manifest.json")
+    args = parser.parse_args()
+
+    report = run_pipeline(args.corpus, args.output, args.batch_size,
+                          args.workers, args.encoding, args.format)
+    print(render_report(report))
+    print(f"✓ Results written: {args.output}")
+
+if __name__ == "__main__":
+    main()